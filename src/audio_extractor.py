@@ -163,6 +163,69 @@ def extract_audio(
         raise AudioExtractionError(f"Audio extraction failed: {str(e)}") from e
 
 
+def extract_audio_to_buffer(video_path: str) -> bytes:
+    """Extract audio from video straight into memory via an FFmpeg pipe.
+
+    FFmpeg writes WAV data to stdout, so audio that is uploaded
+    immediately afterwards never takes the temp-file round-trip
+    through disk.
+
+    Args:
+        video_path: Path to input video file
+
+    Returns:
+        WAV audio data as bytes
+
+    Raises:
+        FFmpegNotFoundError: If FFmpeg is not available
+        FileNotFoundError: If video file doesn't exist
+        AudioExtractionError: If extraction fails
+    """
+    logger.debug(f"extract_audio_to_buffer called: video_path={video_path}")
+
+    # Check FFmpeg availability
+    if not check_ffmpeg_available():
+        logger.error("FFmpeg is not available on this system")
+        raise FFmpegNotFoundError("FFmpeg is not available on this system")
+
+    # Check video file exists
+    video_file = Path(video_path)
+    if not video_file.exists():
+        logger.error(f"Video file not found: {video_path}")
+        raise FileNotFoundError(f"Video file not found: {video_path}")
+
+    try:
+        result = subprocess.run(
+            [
+                'ffmpeg',
+                '-i', str(video_path),
+                '-vn',  # No video
+                '-acodec', 'pcm_s16le',  # PCM 16-bit encoding
+                '-ar', '16000',  # 16kHz sample rate
+                '-ac', '1',  # Mono
+                '-f', 'wav',  # WAV output format with header
+                '-',  # Write to stdout
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+
+        if result.returncode != 0:
+            error_msg = (
+                result.stderr.decode(errors="replace") if result.stderr else "Unknown error"
+            )
+            logger.error(f"FFmpeg extraction failed: {error_msg}")
+            raise AudioExtractionError(f"FFmpeg extraction failed: {error_msg}")
+
+        logger.debug(f"Audio extracted to buffer: {len(result.stdout)} bytes")
+        return result.stdout
+
+    except subprocess.SubprocessError as e:
+        logger.error(f"Audio extraction subprocess error: {str(e)}")
+        raise AudioExtractionError(f"Audio extraction failed: {str(e)}") from e
+
+
 def _parse_ffmpeg_progress(
     stdout,
     progress_callback: Callable[[str], None],
@@ -7,6 +7,10 @@ from typing import Any
 
 import yaml
 
+# Prefer the libyaml C loader when available; it parses roughly 10x faster
+# than the pure-Python SafeLoader and is safe for untrusted input.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid."""
@@ -33,7 +37,7 @@ class ConfigParser:
 
         try:
             with open(self.config_path) as f:
-                self.config = yaml.safe_load(f) or {}
+                self.config = yaml.load(f, Loader=_YAML_LOADER) or {}
         except yaml.YAMLError as e:
             raise ConfigError(f"Invalid YAML in {config_path}: {str(e)}") from e
         except Exception as e:
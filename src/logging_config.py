@@ -5,6 +5,19 @@ Provides structured logging setup with configurable verbosity levels.
 
 import logging
 import sys
+from typing import Optional
+
+# Pre-built format strings per verbosity so repeated calls allocate nothing
+_FORMATS = {
+    True: "[%(levelname)s] %(name)s: %(message)s",
+    False: "[%(levelname)s] %(message)s",
+}
+
+# Noisy third-party loggers suppressed outside verbose mode
+_THIRD_PARTY_LOGGERS = ("mistralai", "httpx", "urllib3")
+
+# Verbosity applied by the previous configure_logging call, if any
+_last_verbose: Optional[bool] = None
 
 
 def configure_logging(verbose: bool = False) -> None:
@@ -14,23 +27,31 @@ def configure_logging(verbose: bool = False) -> None:
         verbose: Enable DEBUG level logging for detailed output.
                 If False, uses INFO level for normal operation.
     """
+    global _last_verbose
+
     log_level = logging.DEBUG if verbose else logging.INFO
-    log_format = (
-        "[%(levelname)s] %(name)s: %(message)s"
-        if verbose
-        else "[%(levelname)s] %(message)s"
-    )
+
+    # Steady-state short-circuit: skip the basicConfig teardown/re-setup when
+    # the previous call already applied this configuration and nothing
+    # external has reset the root logger since
+    if (
+        _last_verbose is verbose
+        and logging.root.level == log_level
+        and logging.root.handlers
+    ):
+        return
 
     # Configure root logger
     logging.basicConfig(
         level=log_level,
-        format=log_format,
+        format=_FORMATS[verbose],
         stream=sys.stderr,
         force=True,
     )
 
     # Suppress noisy third-party loggers unless in verbose mode
     if not verbose:
-        logging.getLogger("mistralai").setLevel(logging.WARNING)
-        logging.getLogger("httpx").setLevel(logging.WARNING)
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
+        for name in _THIRD_PARTY_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+    _last_verbose = verbose
@@ -6,17 +6,22 @@ Supports single video processing and batch processing of multiple videos.
 import logging
 import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Optional
 
-from src.audio_extractor import extract_audio, FFmpegNotFoundError, AudioExtractionError
+from src.audio_extractor import (
+    extract_audio,
+    extract_audio_to_buffer,
+    FFmpegNotFoundError,
+    AudioExtractionError,
+)
 from src.transcription_client import TranscriptionClient, TranscriptionError
 from src.audio_splitter import (
     split_audio,
     needs_splitting,
 )
-from typing import Any
-
 from src.subtitle_generator import SubtitleGenerator, SubtitleFormatError
 
 logger = logging.getLogger(__name__)
@@ -39,6 +44,7 @@ class Pipeline:
         transcription_model: str = "voxtral-mini-latest",
         language: Optional[str] = None,
         verbose_progress: bool = False,
+        stream_audio: bool = False,
     ):
         """Initialize pipeline.
 
@@ -49,6 +55,9 @@ class Pipeline:
             transcription_model: Mistral transcription model (default: voxtral-mini-latest)
             language: Optional language code for transcription (e.g., 'en', 'fr')
             verbose_progress: Enable detailed progress reporting (upload, segments)
+            stream_audio: Pipe extracted audio straight to the transcription
+                upload instead of writing a temp WAV file (only used when the
+                audio is short enough to skip splitting)
 
         Raises:
             ValueError: If API key is not provided
@@ -58,8 +67,10 @@ class Pipeline:
 
         self.api_key = api_key
         self.progress_callback = progress_callback
+        self._progress_lock = threading.Lock()
         self.temp_dir = temp_dir or tempfile.gettempdir()
         self.verbose_progress = verbose_progress
+        self.stream_audio = stream_audio
         logger.debug(
             f"Pipeline initialized: model={transcription_model}, language={language}, "
             f"temp_dir={self.temp_dir}, verbose_progress={verbose_progress}"
@@ -84,22 +95,46 @@ class Pipeline:
         Raises:
             PipelineError: If any job fails
         """
-        results = {}
+        results: dict[str, str] = {}
         total = len(jobs)
 
-        for idx, job in enumerate(jobs, 1):
-            input_path = job["input"]
-            output_path = job["output"]
-            output_format = job.get("format", "srt")
+        if not jobs:
+            return results
+
+        # Unpack the job dicts into parallel lists up front: iteration and
+        # the future bookkeeping then index plain lists instead of hashing
+        # dict keys, and large batches keep one dict per job off the heap
+        inputs = [job["input"] for job in jobs]
+        outputs = [job["output"] for job in jobs]
+        formats = [job.get("format", "srt") for job in jobs]
+
+        # Jobs are independent and dominated by FFmpeg and API latency, so
+        # run them on a thread pool to overlap network round-trips
+        max_workers = min(total, (os.cpu_count() or 1) * 4)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def run_job(index: int) -> str:
+                # Announce from the worker so the message appears when
+                # the job starts, not when the whole batch is queued
+                self._progress(f"[{index + 1}/{total}] Processing: {inputs[index]}")
+                return self.process_video(
+                    inputs[index],
+                    outputs[index],
+                    output_format=formats[index],
+                )
 
-            self._progress(f"[{idx}/{total}] Processing: {input_path}")
+            futures = {executor.submit(run_job, i): inputs[i] for i in range(total)}
 
-            try:
-                result = self.process_video(input_path, output_path, output_format)
-                results[input_path] = result
-            except PipelineError as e:
-                self._progress(f"Failed: {input_path} - {str(e)}")
-                raise
+            for future in as_completed(futures):
+                input_path = futures[future]
+                try:
+                    results[input_path] = future.result()
+                except PipelineError as e:
+                    self._progress(f"Failed: {input_path} - {str(e)}")
+                    # Drop queued jobs so the first failure aborts the
+                    # batch instead of running the rest to completion
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
 
         return results
 
@@ -123,6 +158,10 @@ class Pipeline:
         audio_segments: list[str] = []
 
         logger.debug(f"process_video: video_path={video_path}, output_format={output_format}")
+
+        if self.stream_audio and self._can_stream(video_path):
+            return self._process_video_streamed(video_path, output_path, output_format)
+
         try:
             # Stage 1: Extract audio (0-25%)
             self._progress("Extracting audio from video...", 10)
@@ -176,6 +215,81 @@ class Pipeline:
                     except OSError:
                         pass  # Ignore cleanup errors
 
+    def _can_stream(self, video_path: str) -> bool:
+        """Check whether the in-memory audio path can be used.
+
+        Streaming skips the temp WAV file, which rules out splitting, so
+        it only applies when the source is short enough to upload whole.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            True if the video's audio fits in a single upload
+        """
+        try:
+            # ffprobe reads the container duration, so this works on the
+            # video file directly without extracting audio first
+            return not needs_splitting(video_path)
+        except Exception:
+            return False
+
+    def _process_video_streamed(
+        self, video_path: str, output_path: str, output_format: str = "srt"
+    ) -> str:
+        """Convert video to subtitles without touching disk for audio.
+
+        FFmpeg pipes WAV data straight into memory and the bytes are
+        uploaded as-is, halving the I/O moved per file.
+
+        Args:
+            video_path: Path to input video file
+            output_path: Path to write output subtitle file
+            output_format: Output subtitle format (srt, vtt, webvtt, sbv)
+
+        Returns:
+            Path to generated subtitle file
+
+        Raises:
+            PipelineError: If any stage fails
+        """
+        # Stage 1: Extract audio into memory (0-25%)
+        self._progress("Extracting audio from video...", 10)
+        try:
+            audio_bytes = extract_audio_to_buffer(video_path)
+        except FileNotFoundError as e:
+            logger.error(f"Video file not found: {video_path}")
+            raise PipelineError(f"Video file not found: {str(e)}") from e
+        except (FFmpegNotFoundError, AudioExtractionError) as e:
+            logger.error(f"Audio extraction failed: {str(e)}")
+            raise PipelineError(f"Audio extraction failed: {str(e)}") from e
+        self._progress("Audio extraction complete", 25)
+
+        # Stage 2: Transcribe from the in-memory buffer (30-75%)
+        self._progress("Transcribing audio with Mistral AI...", 30)
+        try:
+            segments = self.transcription_client.transcribe_audio_with_timestamps(
+                f"{Path(video_path).stem}.wav",
+                audio_bytes=audio_bytes,
+            )
+        except TranscriptionError as e:
+            raise PipelineError(f"Transcription failed: {str(e)}") from e
+
+        if not segments:
+            raise PipelineError(
+                "Transcription failed: AI service did not return timestamp data. "
+                "Cannot generate accurate subtitles without timestamps."
+            )
+        self._progress("Transcription processing complete", 75)
+
+        # Stage 3: Generate subtitles (75-100%)
+        self._progress(f"Generating {output_format.upper()} subtitles...", 75)
+        output = self._generate_subtitles(
+            segments, output_path, output_format, self.transcription_client.language
+        )
+        self._progress("Complete! Subtitles generated successfully.", 100)
+        return output
+
     def _extract_audio(self, video_path: str) -> str:
         """Extract audio from video.
 
@@ -278,7 +392,7 @@ class Pipeline:
             raise PipelineError(f"Transcription failed: {str(e)}") from e
 
     def _generate_subtitles(
-        self, segments: List[Dict], output_path: str, output_format: str = "srt", language_code: Optional[str] = None
+        self, segments: list[dict[str, Any]], output_path: str, output_format: str = "srt", language_code: Optional[str] = None
     ) -> str:
         """Generate subtitle file in specified format.
         
@@ -311,8 +425,11 @@ class Pipeline:
             percentage: Optional percentage (0-100)
         """
         if self.progress_callback:
-            # Only include percentage if verbose_progress is True
-            if self.verbose_progress:
-                self.progress_callback(message, percentage)
-            else:
-                self.progress_callback(message, None)
+            # Serialize callback invocations; batch jobs report from worker
+            # threads concurrently
+            with self._progress_lock:
+                # Only include percentage if verbose_progress is True
+                if self.verbose_progress:
+                    self.progress_callback(message, percentage)
+                else:
+                    self.progress_callback(message, None)
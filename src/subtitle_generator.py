@@ -6,8 +6,10 @@ Supported formats:
 - WebVTT: Full .vtt format with metadata
 - SBV (YouTube): .sbv files
 """
+import functools
+import os
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Iterator, Optional
 
 
 class SubtitleFormatError(Exception):
@@ -15,7 +17,11 @@ class SubtitleFormatError(Exception):
     pass
 
 
-def segment_text(text: str, max_chars: int = 42) -> List[str]:
+# Pre-encoded once at import so no render pays for it
+_WEBVTT_HEADER = b"WEBVTT\n\n"
+
+
+def segment_text(text: str, max_chars: int = 42) -> list[str]:
     """Segment text into lines with maximum character length.
     
     Args:
@@ -29,126 +35,268 @@ def segment_text(text: str, max_chars: int = 42) -> List[str]:
         - Preserves word boundaries (doesn't break words)
         - Respects existing newlines
         - Creates multiple lines as needed to stay within max_chars
-        - Prefers 2 lines when possible (industry standard)
+        - Balances line lengths (minimum-raggedness optimal fit), which
+          avoids the orphaned short last lines greedy wrapping produces
     """
     if not text:
         return [text]
-    
-    lines = []
-    current_line = ""
-    
-    # Split by existing newlines first
-    paragraphs = text.split('\n')
-    
-    for paragraph in paragraphs:
-        if not paragraph.strip():
-            if current_line:
-                lines.append(current_line)
-                current_line = ""
+    return list(_segment_text_cached(text, max_chars))
+
+
+# Rendering the same transcript to several formats re-wraps identical
+# captions; memoizing on the text makes every pass after the first a dict
+# lookup. Tuples keep cached results safe from caller mutation.
+@functools.lru_cache(maxsize=4096)
+def _segment_text_cached(text: str, max_chars: int) -> tuple[str, ...]:
+    """Wrap non-empty text and return the lines as a cached tuple."""
+    lines: list[str] = []
+
+    # Split by existing newlines first; each paragraph wraps independently
+    for paragraph in text.split('\n'):
+        words = paragraph.split()
+        if not words:
             continue
-            
-        words = paragraph.split(' ')
-        
-        for word in words:
-            # Check if adding this word would exceed max_chars
-            if current_line and len(current_line) + len(word) + 1 > max_chars:  # +1 for space
-                lines.append(current_line)
-                current_line = word
-            else:
-                if current_line:
-                    current_line += " " + word
-                else:
-                    current_line = word
-        
-        # If we have content and this isn't the last paragraph, add current line
-        if current_line and paragraph != paragraphs[-1]:
-            lines.append(current_line)
-            current_line = ""
-    
-    # Add any remaining content
-    if current_line:
-        lines.append(current_line)
-    
-    # Ensure all lines are within the max_chars limit
-    # This handles cases where the initial segmentation created lines > max_chars
-    final_lines = []
-    for line in lines:
-        if len(line) <= max_chars:
-            final_lines.append(line)
-        else:
-            # Re-segment this line if it exceeds max_chars
-            words = line.split(' ')
-            current = ""
-            for word in words:
-                if current and len(current) + len(word) + 1 > max_chars:
-                    final_lines.append(current)
-                    current = word
-                else:
-                    if current:
-                        current += " " + word
-                    else:
-                        current = word
-            if current:
-                final_lines.append(current)
-    
-    return final_lines
+        joined = " ".join(words)
+        if len(joined) <= max_chars:
+            lines.append(joined)
+            continue
+        _wrap_paragraph(words, max_chars, lines)
+
+    return tuple(lines)
+
+
+def _wrap_paragraph(words: list[str], max_chars: int, lines: list[str]) -> None:
+    """Append optimally wrapped lines for one paragraph's words.
+
+    Dynamic program over break points minimizing the sum of squared
+    trailing gaps (target width minus line width), the Knuth-Plass
+    objective without hyphenation. The inner scan only walks back while
+    the candidate line still fits, so the work is O(words x words per
+    line) rather than O(words^2).
+    """
+    count = len(words)
+    # prefix[i] = width of words[:i] joined by spaces, plus one trailing
+    # space; line words[j:i] is then prefix[i] - prefix[j] - 1 wide
+    prefix = [0] * (count + 1)
+    for index, word in enumerate(words):
+        prefix[index + 1] = prefix[index] + len(word) + 1
+
+    infinity = float("inf")
+    cost = [0.0] + [infinity] * count
+    back = [0] * (count + 1)
+
+    for i in range(1, count + 1):
+        j = i - 1
+        while j >= 0:
+            width = prefix[i] - prefix[j] - 1
+            if width > max_chars:
+                # A single word longer than max_chars stays intact on
+                # its own line with no gap penalty
+                if j == i - 1 and cost[j] < cost[i]:
+                    cost[i] = cost[j]
+                    back[i] = j
+                break
+            candidate = cost[j] + (max_chars - width) ** 2
+            if candidate < cost[i]:
+                cost[i] = candidate
+                back[i] = j
+            j -= 1
+
+    breaks = []
+    i = count
+    while i > 0:
+        breaks.append((back[i], i))
+        i = back[i]
+    for j, i in reversed(breaks):
+        lines.append(" ".join(words[j:i]))
+
+
+def segment_text_batch(texts: list[str], max_chars: int = 42) -> list[list[str]]:
+    """Segment a batch of texts sharing the same wrapping width.
+
+    Args:
+        texts: Input texts to segment
+        max_chars: Maximum characters per line (default: 42)
+
+    Returns:
+        List of segmented line lists, one per input text
+    """
+    return [segment_text(text, max_chars) for text in texts]
+
+
+def _split_timestamp_ms(total_ms: int) -> tuple[int, int, int, int]:
+    """Split integer milliseconds into (hours, minutes, secs, milliseconds).
+
+    Shared by the _fmt_*_ms helpers; divmod halves the number of
+    division ops compared to separate // and % passes.
+
+    Args:
+        total_ms: Time in integer milliseconds
+
+    Returns:
+        Tuple of (hours, minutes, secs, milliseconds) as ints
+    """
+    total_seconds, milliseconds = divmod(total_ms, 1000)
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+
+    return hours, minutes, secs, milliseconds
+
+
+# Timestamps cluster heavily: segment boundaries repeat when the same video
+# is rendered in several formats, so memoizing on integer milliseconds turns
+# repeat formatting into a dict lookup. Caches are per-process and stay warm
+# across all segments of a batch.
+@functools.lru_cache(maxsize=4096)
+def _fmt_srt_ms(total_ms: int) -> str:
+    """Format integer milliseconds as an SRT timestamp."""
+    # %-formatting is a single C-level call, cheaper than per-field f-string
+    # formatting in this hot path
+    return "%02d:%02d:%02d,%03d" % _split_timestamp_ms(total_ms)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_vtt_ms(total_ms: int) -> str:
+    """Format integer milliseconds as a VTT timestamp."""
+    return "%02d:%02d:%02d.%03d" % _split_timestamp_ms(total_ms)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_sbv_ms(total_ms: int) -> str:
+    """Format integer milliseconds as an SBV timestamp."""
+    return "%d:%02d:%02d,%03d" % _split_timestamp_ms(total_ms)
 
 
 def format_timestamp_srt(seconds: float) -> str:
     """Format seconds into SRT timestamp format (HH:MM:SS,mmm).
-    
+
     Args:
         seconds: Time in seconds as float
-        
+
     Returns:
         Formatted SRT timestamp string
     """
-    total_seconds = int(seconds)
-    milliseconds = int((seconds - total_seconds) * 1000)
-    
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
-    
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+    return _fmt_srt_ms(int(round(seconds * 1000)))
 
 
 def format_timestamp_vtt(seconds: float) -> str:
     """Format seconds into VTT timestamp format (HH:MM:SS.mmm).
-    
+
     Args:
         seconds: Time in seconds as float
-        
+
     Returns:
         Formatted VTT timestamp string
     """
-    total_seconds = int(seconds)
-    milliseconds = int((seconds - total_seconds) * 1000)
-    
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
-    
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
+    return _fmt_vtt_ms(int(round(seconds * 1000)))
 
 
 def format_timestamp_sbv(seconds: float) -> str:
     """Format seconds into SBV timestamp format (H:MM:SS,mmm).
-    
+
     Args:
         seconds: Time in seconds as float
-        
+
     Returns:
         Formatted SBV timestamp string
     """
-    total_seconds = int(seconds)
-    milliseconds = int((seconds - total_seconds) * 1000)
-    
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
-    
-    return f"{hours}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+    return _fmt_sbv_ms(int(round(seconds * 1000)))
+
+
+def _iter_pages(
+    entries: list[tuple[float, float, str]], segmented_batch: list[list[str]]
+) -> "Iterator[tuple[float, float, list[str]]]":
+    """Yield (start_time, end_time, page_lines) for each subtitle page.
+
+    Pages hold max 2 lines per subtitle entry (industry standard) and share
+    the segment's duration proportionally, with the last page pinned to the
+    segment's original end time.
+
+    Args:
+        entries: Validated (start, end, text) tuples, one per segment
+        segmented_batch: Wrapped line lists, one per segment
+
+    Yields:
+        Tuples of (page_start_time, page_end_time, page_lines)
+    """
+    for (start_time_seconds, end_time_seconds, _), segmented_lines in zip(
+        entries, segmented_batch
+    ):
+        total_duration = end_time_seconds - start_time_seconds
+        num_pages = (len(segmented_lines) + 1) // 2  # Ceiling division
+        duration_per_page = total_duration / num_pages if num_pages > 0 else total_duration
+
+        for page_index, page_start in enumerate(range(0, len(segmented_lines), 2)):
+            page_end = min(page_start + 2, len(segmented_lines))
+            page_lines = segmented_lines[page_start:page_end]
+
+            page_start_time = start_time_seconds + (page_index * duration_per_page)
+            page_end_time = start_time_seconds + ((page_index + 1) * duration_per_page)
+
+            # Ensure the last page ends at the original end time
+            if page_index == num_pages - 1:
+                page_end_time = end_time_seconds
+
+            yield page_start_time, page_end_time, page_lines
+
+
+# Fixed-shape entry templates: one C-level % substitution per entry beats
+# the piecewise f-string/concat sequence in these hot comprehensions
+_SRT_BLOCK = "%d\n%s --> %s\n%s\n\n"
+_VTT_BLOCK = "%s --> %s\n%s\n\n"
+_SBV_BLOCK = "%s\n%s\n%s\n\n"
+
+
+def _render_srt(
+    entries: list[tuple[float, float, str]], segmented_batch: list[list[str]]
+) -> list[bytes]:
+    """Render segments as a list of encoded SRT entry chunks."""
+    # Local bindings turn the per-entry global/method lookups into
+    # LOAD_FAST inside the comprehension
+    block = _SRT_BLOCK
+    fmt = format_timestamp_srt
+    join = "\n".join
+    return [
+        (block % (index, fmt(start), fmt(end), join(lines))).encode("utf-8")
+        for index, (start, end, lines) in enumerate(
+            _iter_pages(entries, segmented_batch), 1
+        )
+    ]
+
+
+def _render_vtt(
+    entries: list[tuple[float, float, str]], segmented_batch: list[list[str]]
+) -> list[bytes]:
+    """Render segments as a list of encoded WebVTT chunks (header first)."""
+    block = _VTT_BLOCK
+    fmt = format_timestamp_vtt
+    join = "\n".join
+    return [_WEBVTT_HEADER] + [
+        (block % (fmt(start), fmt(end), join(lines))).encode("utf-8")
+        for start, end, lines in _iter_pages(entries, segmented_batch)
+    ]
+
+
+def _render_sbv(
+    entries: list[tuple[float, float, str]], segmented_batch: list[list[str]]
+) -> list[bytes]:
+    """Render segments as a list of encoded SBV entry chunks."""
+    block = _SBV_BLOCK
+    fmt = format_timestamp_sbv
+    join = "\n".join
+    return [
+        (block % (fmt(start), fmt(end), join(lines))).encode("utf-8")
+        for start, end, lines in _iter_pages(entries, segmented_batch)
+    ]
+
+
+# Renderer dispatch selected once per file instead of branching per segment
+_RENDERERS = {
+    "srt": _render_srt,
+    "vtt": _render_vtt,
+    "webvtt": _render_vtt,
+    "sbv": _render_sbv,
+}
 
 
 class SubtitleGenerator:
@@ -187,6 +335,49 @@ class SubtitleGenerator:
         elif output_format == "sbv":
             return self.generate_sbv(segments, final_output_path)
 
+    def render(self, segments: list[dict[str, Any]], output_format: str = "srt") -> str:
+        """Render subtitle content in memory without touching disk.
+
+        Args:
+            segments: List of dicts with 'start', 'end', and 'text' keys
+            output_format: Format to render (srt, vtt, webvtt, sbv)
+
+        Returns:
+            Complete subtitle file content as a string
+
+        Raises:
+            SubtitleFormatError: If format is unsupported or data is invalid
+        """
+        if output_format not in self.SUPPORTED_FORMATS:
+            raise SubtitleFormatError(
+                f"Unsupported format: {output_format}. "
+                f"Must be one of: {', '.join(self.SUPPORTED_FORMATS)}"
+            )
+
+        return b"".join(self._render_chunks(segments, output_format)).decode("utf-8")
+
+    def _render_chunks(
+        self, segments: list[dict[str, Any]], output_format: str
+    ) -> list[bytes]:
+        """Validate segments and render them as encoded per-entry chunks.
+
+        Shared by render and the generate_* writers: texts are wrapped in
+        one batch call and each entry is encoded exactly once.
+
+        Args:
+            segments: List of dicts with 'start', 'end', and 'text' keys
+            output_format: Format to render (srt, vtt, webvtt, sbv)
+
+        Returns:
+            Encoded subtitle content, one entry per chunk
+
+        Raises:
+            SubtitleFormatError: If segment data is invalid
+        """
+        entries = self._validate_segments(segments)
+        segmented_batch = segment_text_batch([entry[2] for entry in entries])
+        return _RENDERERS[output_format](entries, segmented_batch)
+
     def generate_srt(self, segments: list[dict[str, Any]], output_path: str) -> str:
         """Generate SRT file from transcription segments.
         
@@ -200,55 +391,8 @@ class SubtitleGenerator:
         Raises:
             SubtitleFormatError: If format is invalid or required fields missing
         """
-        # Validate segments
-        for segment in segments:
-            self._validate_segment(segment)
-        
-        # Generate SRT content
-        srt_lines = []
-        entry_index = 1
-        
-        for segment in segments:
-            start_time_seconds = segment["start"]
-            end_time_seconds = segment["end"]
-            text = segment["text"]
-            
-            # Apply text segmentation for maximum width constraint
-            segmented_lines = segment_text(text)
-            
-            # Calculate total duration
-            total_duration = end_time_seconds - start_time_seconds
-            
-            # Split into pages of max 2 lines per subtitle entry (industry standard)
-            num_pages = (len(segmented_lines) + 1) // 2  # Ceiling division
-            duration_per_page = total_duration / num_pages if num_pages > 0 else total_duration
-            
-            for page_index, page_start in enumerate(range(0, len(segmented_lines), 2)):
-                page_end = min(page_start + 2, len(segmented_lines))
-                page_lines = segmented_lines[page_start:page_end]
-                
-                # Calculate proportional timestamps for this page
-                page_start_time = start_time_seconds + (page_index * duration_per_page)
-                page_end_time = start_time_seconds + ((page_index + 1) * duration_per_page)
-                
-                # Ensure the last page ends at the original end time
-                if page_index == num_pages - 1:
-                    page_end_time = end_time_seconds
-                
-                page_start_str = format_timestamp_srt(page_start_time)
-                page_end_str = format_timestamp_srt(page_end_time)
-                
-                srt_lines.append(str(entry_index))
-                srt_lines.append(f"{page_start_str} --> {page_end_str}")
-                srt_lines.extend(page_lines)
-                srt_lines.append("")  # Blank line between subtitles
-                
-                entry_index += 1
-        
-        # Write to file
-        output_file = Path(output_path)
-        output_file.write_text("\n".join(srt_lines))
-        
+        chunks = self._render_chunks(segments, "srt")
+        self._write_subtitle_file(output_path, chunks)
         return str(output_path)
 
     def generate_vtt(self, segments: list[dict[str, Any]], output_path: str) -> str:
@@ -264,51 +408,8 @@ class SubtitleGenerator:
         Raises:
             SubtitleFormatError: If format is invalid or required fields missing
         """
-        # Validate segments
-        for segment in segments:
-            self._validate_segment(segment)
-        
-        # Generate VTT content
-        vtt_lines = ["WEBVTT", ""]
-        
-        for segment in segments:
-            start_time_seconds = segment["start"]
-            end_time_seconds = segment["end"]
-            text = segment["text"]
-            
-            # Apply text segmentation for maximum width constraint
-            segmented_lines = segment_text(text)
-            
-            # Calculate total duration
-            total_duration = end_time_seconds - start_time_seconds
-            
-            # Split into pages of max 2 lines per subtitle entry (industry standard)
-            num_pages = (len(segmented_lines) + 1) // 2  # Ceiling division
-            duration_per_page = total_duration / num_pages if num_pages > 0 else total_duration
-            
-            for page_index, page_start in enumerate(range(0, len(segmented_lines), 2)):
-                page_end = min(page_start + 2, len(segmented_lines))
-                page_lines = segmented_lines[page_start:page_end]
-                
-                # Calculate proportional timestamps for this page
-                page_start_time = start_time_seconds + (page_index * duration_per_page)
-                page_end_time = start_time_seconds + ((page_index + 1) * duration_per_page)
-                
-                # Ensure the last page ends at the original end time
-                if page_index == num_pages - 1:
-                    page_end_time = end_time_seconds
-                
-                page_start_str = format_timestamp_vtt(page_start_time)
-                page_end_str = format_timestamp_vtt(page_end_time)
-                
-                vtt_lines.append(f"{page_start_str} --> {page_end_str}")
-                vtt_lines.extend(page_lines)
-                vtt_lines.append("")  # Blank line between subtitles
-        
-        # Write to file
-        output_file = Path(output_path)
-        output_file.write_text("\n".join(vtt_lines))
-        
+        chunks = self._render_chunks(segments, "vtt")
+        self._write_subtitle_file(output_path, chunks)
         return str(output_path)
 
     def generate_sbv(self, segments: list[dict[str, Any]], output_path: str) -> str:
@@ -324,54 +425,67 @@ class SubtitleGenerator:
         Raises:
             SubtitleFormatError: If format is invalid or required fields missing
         """
-        # Validate segments
-        for segment in segments:
-            self._validate_segment(segment)
-        
-        # Generate SBV content
-        sbv_lines = []
-        
-        for segment in segments:
-            start_time_seconds = segment["start"]
-            end_time_seconds = segment["end"]
-            text = segment["text"]
-            
-            # Apply text segmentation for maximum width constraint
-            segmented_lines = segment_text(text)
-            
-            # Calculate total duration
-            total_duration = end_time_seconds - start_time_seconds
-            
-            # Split into pages of max 2 lines per subtitle entry (industry standard)
-            num_pages = (len(segmented_lines) + 1) // 2  # Ceiling division
-            duration_per_page = total_duration / num_pages if num_pages > 0 else total_duration
-            
-            for page_index, page_start in enumerate(range(0, len(segmented_lines), 2)):
-                page_end = min(page_start + 2, len(segmented_lines))
-                page_lines = segmented_lines[page_start:page_end]
-                
-                # Calculate proportional timestamps for this page
-                page_start_time = start_time_seconds + (page_index * duration_per_page)
-                page_end_time = start_time_seconds + ((page_index + 1) * duration_per_page)
-                
-                # Ensure the last page ends at the original end time
-                if page_index == num_pages - 1:
-                    page_end_time = end_time_seconds
-                
-                page_start_str = format_timestamp_sbv(page_start_time)
-                page_end_str = format_timestamp_sbv(page_end_time)
-                
-                sbv_lines.append(page_start_str)
-                sbv_lines.append(page_end_str)
-                sbv_lines.extend(page_lines)
-                sbv_lines.append("")  # Blank line between subtitles
-        
-        # Write to file
-        output_file = Path(output_path)
-        output_file.write_text("\n".join(sbv_lines))
-        
+        chunks = self._render_chunks(segments, "sbv")
+        self._write_subtitle_file(output_path, chunks)
         return str(output_path)
 
+    #: os.writev only pays off once there are enough chunks for the joined
+    #: copy to matter; below this, a single join + write is cheaper
+    _WRITEV_MIN_CHUNKS = 512
+
+    #: Maximum buffers per writev(2) call (IOV_MAX on Linux)
+    _IOV_MAX = 1024
+
+    def _write_subtitle_file(self, output_path: str, chunks: list[bytes]) -> None:
+        """Write rendered subtitle chunks with as few syscalls as possible.
+
+        Large outputs go through os.writev, which takes the chunk list
+        directly and so avoids the O(N) joined copy; small outputs (and
+        platforms without writev) fall back to one join + write.
+
+        Args:
+            output_path: Path to write subtitle file
+            chunks: Encoded subtitle content, one entry per chunk
+        """
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, "writev") and len(chunks) > self._WRITEV_MIN_CHUNKS:
+                for start in range(0, len(chunks), self._IOV_MAX):
+                    batch = chunks[start:start + self._IOV_MAX]
+                    written = os.writev(fd, batch)
+                    if written != sum(len(chunk) for chunk in batch):
+                        # Short writev: finish this batch with resumed
+                        # plain writes before moving to the next one
+                        self._write_all(fd, b"".join(batch)[written:])
+            else:
+                self._write_all(fd, b"".join(chunks))
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _write_all(fd: int, payload: bytes) -> None:
+        """Write payload to fd fully, resuming after short writes.
+
+        os.write may report fewer bytes than requested (ENOSPC, quotas,
+        RLIMIT_FSIZE); resuming from the returned count preserves the
+        complete-file-or-OSError guarantee of the old buffered writer.
+
+        Args:
+            fd: Open file descriptor to write to
+            payload: Bytes to write in full
+
+        Raises:
+            OSError: If a write fails or stops making progress
+        """
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            if written == 0:
+                raise OSError(
+                    f"write stalled with {len(view)} bytes unwritten"
+                )
+            view = view[written:]
+
     def _generate_output_filename(self, output_path: str, output_format: str, language_code: Optional[str] = None) -> str:
         """Generate proper output filename with language code if provided.
         
@@ -481,3 +595,42 @@ class SubtitleGenerator:
             raise SubtitleFormatError(
                 f"Invalid timecode range: end ({end}) before start ({start})"
             )
+
+    def _validate_segments(
+        self, segments: list[dict[str, Any]]
+    ) -> list[tuple[float, float, str]]:
+        """Validate all segments and extract their fields in one pass.
+
+        The happy path is a single tight loop with no per-segment set
+        construction; only a segment that fails the combined check is
+        re-examined by _validate_segment, which raises the same detailed
+        error messages as before. Returning the extracted (start, end,
+        text) tuples lets the renderers index positionally instead of
+        repeating the dict lookups.
+
+        Args:
+            segments: Segment dictionaries to validate
+
+        Returns:
+            List of validated (start, end, text) tuples
+
+        Raises:
+            SubtitleFormatError: If any segment fails validation
+        """
+        number = (int, float)
+        entries: list[tuple[float, float, str]] = []
+        append = entries.append
+        for segment in segments:
+            start = segment.get("start")
+            end = segment.get("end")
+            if (
+                "text" in segment
+                and isinstance(start, number)
+                and isinstance(end, number)
+                and 0 <= start <= end
+            ):
+                append((start, end, segment["text"]))
+                continue
+            self._validate_segment(segment)
+            append((segment["start"], segment["end"], segment["text"]))
+        return entries
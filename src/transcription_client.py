@@ -1,15 +1,80 @@
 """Transcription client for Mistral AI Voxtral Mini."""
 
+import asyncio
+import atexit
+import functools
+import io
 import logging
+import operator
 import os
+import queue
+import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator
 
-from mistralai.client import Mistral
-from mistralai.client.models import File
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
+# The Mistral SDK and httpx are imported lazily on first client
+# construction: importing src.pipeline (and thus this module) should not
+# pay their import cost, which dominates pytest collection for tests that
+# only mock the client. The names stay module-level so
+# patch("src.transcription_client.Mistral") keeps working.
+Mistral: Any = None
+File: Any = None
+
+
+def _load_sdk() -> None:
+    """Resolve the lazy Mistral SDK imports on first use.
+
+    Each name is checked independently so a test that patches Mistral
+    with a mock still gets the real File model for upload payloads.
+    """
+    global Mistral, File
+    if Mistral is None:
+        from mistralai.client import Mistral as _Mistral
+
+        Mistral = _Mistral
+    if File is None:
+        from mistralai.client.models import File as _File
+
+        File = _File
+
+
+#: Process-wide HTTP client handed to the SDK so every transcription call
+#: reuses warm TCP+TLS connections instead of re-handshaking per request.
+_http_client: "httpx.Client | None" = None
+
+
+def _get_http_client() -> "httpx.Client":
+    """Return the shared httpx client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+
+        limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        try:
+            _http_client = httpx.Client(http2=True, timeout=60.0, limits=limits)
+        except ImportError:
+            # h2 is not installed; HTTP/1.1 keep-alive still reuses connections
+            _http_client = httpx.Client(timeout=60.0, limits=limits)
+        atexit.register(_http_client.close)
+    return _http_client
+
+
+@functools.lru_cache(maxsize=4)
+def _load_audio_bytes(audio_path: str, size: int, mtime_ns: int) -> bytes:
+    """Read audio bytes, cached on (path, size, mtime).
+
+    Retrying a failed segment hits the cache instead of re-reading the
+    file from disk; size and mtime in the key invalidate the entry if
+    the file is replaced. maxsize bounds memory to a few segments.
+    """
+    with open(audio_path, "rb") as f:
+        return f.read()
+
 
 class TranscriptionError(Exception):
     """Raised when transcription fails."""
@@ -23,9 +88,70 @@ class AudioFileError(Exception):
     pass
 
 
+class _UploadReader(io.BufferedReader):
+    """File reader that reports progress as the HTTP client consumes it.
+
+    Passing a reader instead of bytes lets the SDK stream the multipart
+    body, so memory use stays at O(chunk size) and the network transfer
+    overlaps the disk read. Progress fires only when the integer
+    percentage changes.
+    """
+
+    def __init__(
+        self,
+        raw: io.RawIOBase,
+        file_size: int,
+        progress_callback: Any | None = None,
+        segment_number: int | None = None,
+        total_segments: int | None = None,
+    ):
+        super().__init__(raw)
+        self._file_size = file_size
+        self._progress_callback = progress_callback
+        self._segment_number = segment_number
+        self._total_segments = total_segments
+        self._bytes_read = 0
+        self._last_percentage = -1
+        self._mb_total_str = f"{file_size / 1048576:.1f}"
+
+    def read(self, size: int = -1) -> bytes:
+        data = super().read(size)
+        if data:
+            self._report(len(data))
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        data = super().read1(size)
+        if data:
+            self._report(len(data))
+        return data
+
+    def _report(self, num_bytes: int) -> None:
+        self._bytes_read += num_bytes
+        if not (self._progress_callback and self._segment_number and self._total_segments):
+            return
+        if self._file_size <= 0:
+            return
+
+        percentage = min(100, (self._bytes_read * 100) // self._file_size)
+        if percentage != self._last_percentage:
+            self._last_percentage = percentage
+            mb_read = self._bytes_read / 1048576
+            self._progress_callback(
+                f"Uploading segment {self._segment_number}/{self._total_segments}: {mb_read:.1f}/{self._mb_total_str} MB ({percentage}%)",
+                percentage,
+            )
+
+
 class TranscriptionClient:
     """Client for transcribing audio using Mistral AI Voxtral Mini."""
 
+    #: Mistral clients shared across instances so the underlying HTTP
+    #: connection pool (and its warm TLS sessions) persists between jobs.
+    #: The SDK class is part of the key so a replaced class (e.g. a test
+    #: double) never hits another instance's cached client.
+    _client_cache: "dict[tuple[str, Any], Any]" = {}
+
     def __init__(
         self,
         api_key: str,
@@ -52,7 +178,107 @@ class TranscriptionClient:
         self.language = language
         self.progress_callback = progress_callback
         logger.debug(f"TranscriptionClient initialized: model={model}, language={language}")
-        self.client = Mistral(api_key=self.api_key)
+        _load_sdk()
+        cache_key = (self.api_key, Mistral)
+        client = self._client_cache.get(cache_key)
+        if client is None:
+            client = self._client_cache.setdefault(
+                cache_key,
+                Mistral(api_key=self.api_key, client=_get_http_client()),
+            )
+        self.client = client
+        self._base_kwargs = {"model": model}
+
+    def _open_upload_file(
+        self,
+        audio_path: str,
+        segment_number: int | None = None,
+        total_segments: int | None = None,
+    ) -> "tuple[Any, File, int]":
+        """Open an audio file for upload and wrap it in the SDK File model.
+
+        Args:
+            audio_path: Path to audio file
+            segment_number: Optional segment number (for progress reporting)
+            total_segments: Optional total segments (for progress reporting)
+
+        Returns:
+            Tuple of (file handle to close after the API call, File object,
+            file size in bytes)
+
+        Raises:
+            FileNotFoundError: If the audio file does not exist
+        """
+        audio_file = open(audio_path, "rb")
+
+        # One fstat on the open descriptor instead of separate exists() and
+        # getsize() path traversals. File objects without a real descriptor
+        # (e.g. test doubles) fall back to getsize, then to 0.
+        try:
+            file_size = os.fstat(audio_file.fileno()).st_size
+        except (OSError, TypeError):
+            try:
+                file_size = os.path.getsize(audio_path)
+            except OSError:
+                file_size = 0
+
+        # Hint the kernel that the whole file is about to be read
+        # sequentially so the page cache can prefetch it. Advisory
+        # only; ignore failures on platforms/file objects without it.
+        try:
+            fd = audio_file.fileno()
+            os.posix_fadvise(fd, 0, file_size, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, file_size, os.POSIX_FADV_WILLNEED)
+        except (AttributeError, OSError, TypeError):
+            pass
+
+        # Stream the upload: the SDK pulls from the reader while
+        # sending, so the segment is never fully buffered in memory.
+        # File objects that are not real buffered readers (e.g. test
+        # doubles) are read up front instead.
+        if isinstance(audio_file, io.BufferedReader):
+            audio_file = _UploadReader(
+                audio_file.detach(),
+                file_size,
+                progress_callback=self.progress_callback,
+                segment_number=segment_number,
+                total_segments=total_segments,
+            )
+            file_content = audio_file
+        else:
+            file_content = audio_file.read()
+
+        file_obj = File(
+            content=file_content,
+            fileName=os.path.basename(audio_path),
+            contentType="audio/wav",
+        )
+        return audio_file, file_obj, file_size
+
+    def _report_upload_edge(
+        self,
+        segment_number: int | None,
+        total_segments: int | None,
+        file_size: int,
+        percentage: int,
+    ) -> None:
+        """Report an upload start/complete edge if progress tracking is enabled.
+
+        Args:
+            segment_number: Segment number, or None when progress is disabled
+            total_segments: Total segments, or None when progress is disabled
+            file_size: Size of the file in bytes
+            percentage: Upload percentage to report (0 or 100)
+        """
+        if not (self.progress_callback and segment_number and total_segments):
+            return
+
+        mb_total = file_size / 1048576
+        mb_done = mb_total if percentage == 100 else 0
+        self.progress_callback(
+            f"Uploading segment {segment_number}/{total_segments}: {mb_done:.1f} / {mb_total:.1f} MB ({percentage}%)",
+            percentage,
+        )
 
     def transcribe_audio(
         self,
@@ -76,82 +302,280 @@ class TranscriptionClient:
             AudioFileError: If audio file not found
             TranscriptionError: If transcription fails
         """
-        audio_file = Path(audio_path)
-        if not audio_file.exists():
+        logger.debug(f"Transcribing audio: {audio_path}")
+        lang = language or self.language
+
+        try:
+            audio_file, file_obj, file_size = self._open_upload_file(
+                audio_path, segment_number, total_segments
+            )
+        except FileNotFoundError:
             logger.error(f"Audio file not found: {audio_path}")
             raise AudioFileError(f"Audio file not found: {audio_path}")
 
         try:
-            logger.debug(f"Transcribing audio: {audio_path}")
-            lang = language or self.language
-            file_size = os.path.getsize(audio_path)
-            uploaded_bytes = 0
-            chunk_size = 1024 * 1024  # 1MB chunks
-
-            # Report upload start if progress tracking enabled
-            if self.progress_callback and segment_number and total_segments:
-                self.progress_callback(
-                    f"Uploading segment {segment_number}/{total_segments}: 0 / {file_size / 1024 / 1024:.1f} MB (0%)",
-                    0
-                )
-
-            with open(audio_path, "rb") as audio_file:
-                file_content = b""
-                while uploaded_bytes < file_size:
-                    chunk = audio_file.read(min(chunk_size, file_size - uploaded_bytes))
-                    if not chunk:
-                        break
-                    file_content += chunk
-                    uploaded_bytes += len(chunk)
-
-                    # Calculate and report progress
-                    if self.progress_callback and segment_number and total_segments:
-                        percentage = int((uploaded_bytes / file_size) * 100)
-                        mb_uploaded = uploaded_bytes / (1024 * 1024)
-                        mb_total = file_size / (1024 * 1024)
-                        self.progress_callback(
-                            f"Uploading segment {segment_number}/{total_segments}: {mb_uploaded:.1f}/{mb_total:.1f} MB ({percentage}%)",
-                            percentage
-                        )
-
-                file_obj = File(
-                    content=file_content,
-                    fileName=Path(audio_path).name,
-                    contentType="audio/wav",
-                )
+            self._report_upload_edge(segment_number, total_segments, file_size, 0)
 
-                # Report upload complete
-                if self.progress_callback and segment_number and total_segments:
-                    self.progress_callback(
-                        f"Uploading segment {segment_number}/{total_segments}: {file_size / 1024 / 1024:.1f} / {file_size / 1024 / 1024:.1f} MB (100%)",
-                        100
-                    )
-
-                kwargs = {"model": self.model, "file": file_obj}
+            try:
+                kwargs = {**self._base_kwargs, "file": file_obj}
                 if lang:
                     kwargs["language"] = lang
                 logger.debug(f"Calling Mistral API: model={self.model}, language={lang}")
                 response = self.client.audio.transcriptions.complete(**kwargs)
                 logger.debug(f"Transcription response received, text length: {len(response.text)}")
+            finally:
+                audio_file.close()
+
+            self._report_upload_edge(segment_number, total_segments, file_size, 100)
+
+            return response.text
+        except Exception as e:
+            logger.error(f"Transcription failed: {str(e)}")
+            raise TranscriptionError(f"Transcription failed: {str(e)}") from e
+
+    def _transcribe_content(
+        self,
+        content: bytes,
+        filename: str,
+        language: str | None = None,
+    ) -> str:
+        """Transcribe already-loaded audio bytes.
+
+        Args:
+            content: Raw audio bytes
+            filename: Filename to report to the API
+            language: Optional language code. Overrides instance default if provided.
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        try:
+            file_obj = File(
+                content=content,
+                fileName=filename,
+                contentType="audio/wav",
+            )
+            kwargs = {**self._base_kwargs, "file": file_obj}
+            lang = language or self.language
+            if lang:
+                kwargs["language"] = lang
+            response = self.client.audio.transcriptions.complete(**kwargs)
             return response.text
         except Exception as e:
             logger.error(f"Transcription failed: {str(e)}")
             raise TranscriptionError(f"Transcription failed: {str(e)}") from e
 
+    def transcribe_sequence(
+        self,
+        audio_paths: list[str],
+        language: str | None = None,
+    ) -> Iterator[str]:
+        """Transcribe audio files in order, overlapping disk reads with uploads.
+
+        A background thread pre-reads the next segment while the current
+        one is uploading, so disk and network wait states overlap instead
+        of alternating. The bounded queue caps memory at two segments.
+
+        Args:
+            audio_paths: Paths to audio files to transcribe, in order
+            language: Optional language code. Overrides instance default if provided.
+
+        Yields:
+            Transcribed text for each path, in input order
+
+        Raises:
+            AudioFileError: If an audio file cannot be read
+            TranscriptionError: If transcription fails
+        """
+        pending: queue.Queue = queue.Queue(maxsize=1)
+        stop = threading.Event()
+
+        def offer(item: "tuple[str, bytes | None, OSError | None] | None") -> bool:
+            """Put with periodic stop checks so an abandoned generator
+            cannot leave the producer blocked on the bounded queue."""
+            while not stop.is_set():
+                try:
+                    pending.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            for path in audio_paths:
+                try:
+                    with open(path, "rb") as f:
+                        content = f.read()
+                except OSError as e:
+                    offer((path, None, e))
+                    return
+                if not offer((path, content, None)):
+                    return
+            offer(None)
+
+        reader = threading.Thread(target=produce, daemon=True)
+        reader.start()
+
+        try:
+            while True:
+                item = pending.get()
+                if item is None:
+                    break
+                path, content, error = item
+                if error is not None:
+                    raise AudioFileError(f"Failed to read audio file {path}: {str(error)}")
+                yield self._transcribe_content(content, os.path.basename(path), language)
+        finally:
+            # Signal the producer and drain its in-flight item so the
+            # thread (and the audio bytes it holds) exits promptly when
+            # iteration stops early
+            stop.set()
+            try:
+                while True:
+                    pending.get_nowait()
+            except queue.Empty:
+                pass
+
+    async def transcribe_audio_async(
+        self,
+        audio_path: str,
+        language: str | None = None,
+    ) -> str:
+        """Transcribe audio file to text without blocking the event loop.
+
+        Args:
+            audio_path: Path to audio file
+            language: Optional language code. Overrides instance default if provided.
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            AudioFileError: If audio file not found
+            TranscriptionError: If transcription fails
+        """
+        audio_file = Path(audio_path)
+        if not audio_file.exists():
+            logger.error(f"Audio file not found: {audio_path}")
+            raise AudioFileError(f"Audio file not found: {audio_path}")
+
+        def read_content() -> bytes:
+            try:
+                st = os.stat(audio_path)
+            except OSError:
+                st = None
+
+            if st is not None:
+                return _load_audio_bytes(audio_path, st.st_size, st.st_mtime_ns)
+
+            # File objects that cannot be stat'd (e.g. test doubles)
+            # are read directly without caching
+            with open(audio_path, "rb") as f:
+                return f.read()
+
+        try:
+            lang = language or self.language
+            # Read off the event loop so the disk read for one segment
+            # overlaps the in-flight HTTP POST of another
+            content = await asyncio.to_thread(read_content)
+
+            file_obj = File(
+                content=content,
+                fileName=audio_file.name,
+                contentType="audio/wav",
+            )
+
+            kwargs = {"model": self.model, "file": file_obj}
+            if lang:
+                kwargs["language"] = lang
+            logger.debug(f"Calling Mistral API (async): model={self.model}, language={lang}")
+            response = await self.client.audio.transcriptions.complete_async(**kwargs)
+            return response.text
+        except Exception as e:
+            logger.error(f"Transcription failed: {str(e)}")
+            raise TranscriptionError(f"Transcription failed: {str(e)}") from e
+
+    async def transcribe_segments(
+        self,
+        audio_paths: list[str],
+        language: str | None = None,
+        max_concurrency: int = 4,
+    ) -> list[str]:
+        """Transcribe multiple audio files concurrently.
+
+        Requests are issued in parallel up to max_concurrency so that
+        network and model latency overlap across segments instead of
+        accumulating serially.
+
+        Args:
+            audio_paths: Paths to audio files to transcribe
+            language: Optional language code. Overrides instance default if provided.
+            max_concurrency: Maximum number of in-flight requests (rate-limit guard)
+
+        Returns:
+            Transcribed texts in the same order as audio_paths
+
+        Raises:
+            AudioFileError: If an audio file is not found
+            TranscriptionError: If any transcription fails
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def transcribe_one(path: str) -> str:
+            async with semaphore:
+                return await self.transcribe_audio_async(path, language)
+
+        return list(await asyncio.gather(*(transcribe_one(p) for p in audio_paths)))
+
+    def transcribe_many(
+        self,
+        audio_paths: list[str],
+        language: str | None = None,
+        max_concurrency: int = 4,
+    ) -> list[str]:
+        """Transcribe multiple audio files from synchronous code.
+
+        Convenience wrapper that runs transcribe_segments on a fresh
+        event loop, so callers without one still get the overlapped
+        uploads.
+
+        Args:
+            audio_paths: Paths to audio files to transcribe
+            language: Optional language code. Overrides instance default if provided.
+            max_concurrency: Maximum number of in-flight requests (rate-limit guard)
+
+        Returns:
+            Transcribed texts in the same order as audio_paths
+
+        Raises:
+            AudioFileError: If an audio file is not found
+            TranscriptionError: If any transcription fails
+        """
+        return asyncio.run(
+            self.transcribe_segments(audio_paths, language, max_concurrency)
+        )
+
     def transcribe_audio_with_timestamps(
         self,
         audio_path: str,
         language: str | None = None,
         segment_number: int | None = None,
         total_segments: int | None = None,
+        audio_bytes: bytes | None = None,
     ) -> list[dict[str, Any]]:
         """Transcribe audio with timestamp information.
 
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file (used only as the reported
+                filename when audio_bytes is provided)
             language: Optional language code. Overrides instance default if provided.
             segment_number: Optional segment number (for progress reporting)
             total_segments: Optional total segments (for progress reporting)
+            audio_bytes: Optional in-memory audio data; skips the file read
+                when the audio was piped straight out of FFmpeg
 
         Returns:
             List of segments with start, end times and text
@@ -161,57 +585,30 @@ class TranscriptionClient:
             TranscriptionError: If transcription fails
             Note: timestamp_granularities is not compatible with language per Mistral docs
         """
-        audio_file = Path(audio_path)
-        if not audio_file.exists():
-            raise AudioFileError(f"Audio file not found: {audio_path}")
-
-        try:
-            lang = language or self.language
-            file_size = os.path.getsize(audio_path)
-            uploaded_bytes = 0
-            chunk_size = 1024 * 1024  # 1MB chunks
-
-            # Report upload start if progress tracking enabled
-            if self.progress_callback and segment_number and total_segments:
-                self.progress_callback(
-                    f"Uploading segment {segment_number}/{total_segments}: 0 / {file_size / 1024 / 1024:.1f} MB (0%)",
-                    0
+        lang = language or self.language
+
+        if audio_bytes is not None:
+            audio_file = None
+            file_obj = File(
+                content=audio_bytes,
+                fileName=os.path.basename(audio_path),
+                contentType="audio/wav",
+            )
+            file_size = len(audio_bytes)
+        else:
+            try:
+                audio_file, file_obj, file_size = self._open_upload_file(
+                    audio_path, segment_number, total_segments
                 )
+            except FileNotFoundError:
+                raise AudioFileError(f"Audio file not found: {audio_path}")
 
-            with open(audio_path, "rb") as audio_file:
-                file_content = b""
-                while uploaded_bytes < file_size:
-                    chunk = audio_file.read(min(chunk_size, file_size - uploaded_bytes))
-                    if not chunk:
-                        break
-                    file_content += chunk
-                    uploaded_bytes += len(chunk)
-
-                    # Calculate and report progress
-                    if self.progress_callback and segment_number and total_segments:
-                        percentage = int((uploaded_bytes / file_size) * 100)
-                        mb_uploaded = uploaded_bytes / (1024 * 1024)
-                        mb_total = file_size / (1024 * 1024)
-                        self.progress_callback(
-                            f"Uploading segment {segment_number}/{total_segments}: {mb_uploaded:.1f}/{mb_total:.1f} MB ({percentage}%)",
-                            percentage
-                        )
-
-                file_obj = File(
-                    content=file_content,
-                    fileName=Path(audio_path).name,
-                    contentType="audio/wav",
-                )
-
-                # Report upload complete
-                if self.progress_callback and segment_number and total_segments:
-                    self.progress_callback(
-                        f"Uploading segment {segment_number}/{total_segments}: {file_size / 1024 / 1024:.1f} / {file_size / 1024 / 1024:.1f} MB (100%)",
-                        100
-                    )
+        try:
+            self._report_upload_edge(segment_number, total_segments, file_size, 0)
 
+            try:
                 kwargs = {
-                    "model": self.model,
+                    **self._base_kwargs,
                     "file": file_obj,
                     "timestamp_granularities": ["segment"],
                 }
@@ -221,25 +618,32 @@ class TranscriptionClient:
                 # if lang:
                 #     kwargs.pop("timestamp_granularities", None)
                 #     kwargs["language"] = lang
-                logger.debug(f"Calling Mistral API with timestamps: {kwargs.keys()}")
+                # Lazy %s formatting: the logger skips rendering entirely
+                # when DEBUG is disabled, unlike eager f-strings
+                logger.debug("Calling Mistral API with timestamps: %s", list(kwargs))
                 response = self.client.audio.transcriptions.complete(**kwargs)
-                logger.debug(f"Transcription response type: {type(response)}")
-                logger.debug(f"Transcription response dir: {dir(response)}")
-                logger.debug(f"Transcription response: {response}")
+                logger.debug(
+                    "Transcription response (%s): %s", type(response).__name__, response
+                )
+            finally:
+                if audio_file is not None:
+                    audio_file.close()
+
+            self._report_upload_edge(segment_number, total_segments, file_size, 100)
 
-            segments = []
             if hasattr(response, "segments"):
-                logger.debug(f"Response has segments attribute with {len(response.segments)} segments")
-                for segment in response.segments:
-                    segments.append(
-                        {
-                            "start": segment.start,
-                            "end": segment.end,
-                            "text": segment.text,
-                        }
-                    )
+                logger.debug("Response has %d timestamped segments", len(response.segments))
+                # attrgetter pulls all three fields per row at C level,
+                # replacing three interpreted attribute lookups each
+                get_fields = operator.attrgetter("start", "end", "text")
+                keys = ("start", "end", "text")
+                segments = [
+                    dict(zip(keys, get_fields(segment)))
+                    for segment in response.segments
+                ]
             else:
-                logger.warning(f"Response does not have 'segments' attribute. Response attributes: {vars(response) if hasattr(response, '__dict__') else 'no __dict__'}")
+                logger.warning("Response does not have 'segments' attribute: %r", response)
+                segments = []
 
             return segments
         except Exception as e:
@@ -0,0 +1,130 @@
+"""Shared pytest configuration for the test suite."""
+import warnings
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _ensure_libyaml():
+    """Warn when PyYAML lacks libyaml so slow config parsing is visible.
+
+    ConfigParser falls back to the pure-Python SafeLoader when the C
+    extension is missing, so this is a performance warning, not a failure.
+    """
+    if not hasattr(yaml, "CSafeLoader"):
+        warnings.warn(
+            "PyYAML was built without libyaml; config parsing uses the "
+            "slower pure-Python loader",
+            RuntimeWarning,
+        )
+
+
+@pytest.fixture(autouse=True)
+def _clear_lru_caches():
+    """Clear the src-module lru_caches after each test.
+
+    The timestamp formatters and audio-bytes loader memoize across
+    calls; clearing between tests keeps results computed under one
+    test's mocks from leaking into the next.
+    """
+    yield
+    import src.subtitle_generator as subtitle_generator
+    import src.transcription_client as transcription_client
+
+    for cached in (
+        subtitle_generator._segment_text_cached,
+        subtitle_generator._fmt_srt_ms,
+        subtitle_generator._fmt_vtt_ms,
+        subtitle_generator._fmt_sbv_ms,
+        transcription_client._load_audio_bytes,
+    ):
+        cached.cache_clear()
+
+
+class PathStub:
+    """Minimal pathlib.Path stand-in for tests that patch a module's Path.
+
+    Much cheaper than a MagicMock tree; covers only what the pipeline
+    touches: exists/stat/stem, the / operator, and str conversion.
+    """
+
+    def __init__(self, stem="test_video", st_size=1024):
+        self.stem = stem
+        self._st_size = st_size
+
+    def exists(self):
+        return True
+
+    def stat(self):
+        return SimpleNamespace(st_size=self._st_size)
+
+    def __truediv__(self, other):
+        return self
+
+    def __fspath__(self):
+        return self.stem
+
+    def __str__(self):
+        return self.stem
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _preimport():
+    """Import the core src modules once before any test runs.
+
+    Mock targets resolve against warm sys.modules entries instead of
+    triggering module import work mid-test, which also keeps xdist
+    workers from paying the import cost at first patch.
+    """
+    import src.pipeline  # noqa: F401
+    import src.subtitle_generator  # noqa: F401
+    import src.transcription_client  # noqa: F401
+
+
+@pytest.fixture(scope="module")
+def _pipeline_patches():
+    """Patch src.pipeline dependencies once per module.
+
+    Applying the five patches per test dominates the runtime of the
+    near-instant pipeline tests; module scope pays the _patch
+    setup/teardown cost once.
+    """
+    from src import pipeline
+
+    mocks = SimpleNamespace(
+        extract_audio=MagicMock(),
+        needs_splitting=MagicMock(),
+        split_audio=MagicMock(),
+        transcription_client_cls=MagicMock(),
+        subtitle_generator_cls=MagicMock(),
+    )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pipeline, "extract_audio", mocks.extract_audio)
+        mp.setattr(pipeline, "needs_splitting", mocks.needs_splitting)
+        mp.setattr(pipeline, "split_audio", mocks.split_audio)
+        mp.setattr(pipeline, "TranscriptionClient", mocks.transcription_client_cls)
+        mp.setattr(pipeline, "SubtitleGenerator", mocks.subtitle_generator_cls)
+        yield mocks
+
+
+@pytest.fixture
+def pipeline_mocks(_pipeline_patches):
+    """Yield the patched pipeline dependencies, reset and re-wired per test.
+
+    Tests override the specific return_value/side_effect they exercise;
+    defaults model the common single-segment path (no splitting).
+    """
+    mocks = _pipeline_patches
+    for mock in vars(mocks).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+    mocks.transcription = MagicMock()
+    mocks.transcription_client_cls.return_value = mocks.transcription
+    mocks.generator = MagicMock()
+    mocks.subtitle_generator_cls.return_value = mocks.generator
+    mocks.needs_splitting.return_value = False
+    return mocks
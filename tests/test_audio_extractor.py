@@ -422,3 +422,45 @@ class TestAudioExtractionSubprocessError:
         # Act & Assert
         with pytest.raises(AudioExtractionError):
             extract_audio(str(video_path), str(output_path))
+
+
+class TestExtractAudioToBuffer:
+    """Test in-memory audio extraction via FFmpeg pipe."""
+
+    @patch('subprocess.run')
+    @patch('src.audio_extractor.check_ffmpeg_available')
+    def test_extract_audio_to_buffer_success(self, mock_check_ffmpeg, mock_run, tmp_path):
+        """Test successful extraction returns WAV bytes from stdout."""
+        from src.audio_extractor import extract_audio_to_buffer
+
+        # Arrange
+        mock_check_ffmpeg.return_value = True
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"RIFF_wav_data", stderr=b"")
+
+        video_path = tmp_path / "test_video.mp4"
+        video_path.touch()
+
+        # Act
+        result = extract_audio_to_buffer(str(video_path))
+
+        # Assert
+        assert result == b"RIFF_wav_data"
+        cmd = mock_run.call_args[0][0]
+        assert cmd[-1] == "-"  # FFmpeg writes to stdout
+
+    @patch('subprocess.run')
+    @patch('src.audio_extractor.check_ffmpeg_available')
+    def test_extract_audio_to_buffer_ffmpeg_error(self, mock_check_ffmpeg, mock_run, tmp_path):
+        """Test extraction failure raises AudioExtractionError."""
+        from src.audio_extractor import extract_audio_to_buffer, AudioExtractionError
+
+        # Arrange
+        mock_check_ffmpeg.return_value = True
+        mock_run.return_value = MagicMock(returncode=1, stdout=b"", stderr=b"bad input")
+
+        video_path = tmp_path / "test_video.mp4"
+        video_path.touch()
+
+        # Act & Assert
+        with pytest.raises(AudioExtractionError, match="FFmpeg extraction failed"):
+            extract_audio_to_buffer(str(video_path))
@@ -1,33 +1,49 @@
 """Tests for CLI module."""
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock, patch
 from pathlib import Path
 from click.testing import CliRunner
+from src import cli
 from src.cli import main
 
 
+@pytest.fixture(scope="module")
+def runner():
+    """Shared CliRunner instance; stateless between invocations."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def help_output():
+    """Cached --help output so help assertions skip a full Click dispatch."""
+    result = CliRunner().invoke(main, ['--help'])
+    assert result.exit_code == 0
+    return result.output
+
+
+@pytest.fixture(scope="session")
+def version_output():
+    """Cached --version output."""
+    result = CliRunner().invoke(main, ['--version'])
+    assert result.exit_code == 0
+    return result.output
+
+
 class TestCLI:
     """Test command-line interface."""
 
-    def test_cli_help(self):
+    def test_cli_help(self, help_output):
         """Test CLI help message."""
-        # Arrange
-        runner = CliRunner()
-        
-        # Act
-        result = runner.invoke(main, ['--help'])
-        
-        # Assert
-        assert result.exit_code == 0
-        assert 'Usage:' in result.output
-        assert '--input' in result.output or '-i' in result.output
-        assert '--output' in result.output or '-o' in result.output
+        # Assert against the cached help text
+        assert 'Usage:' in help_output
+        assert '--input' in help_output or '-i' in help_output
+        assert '--output' in help_output or '-o' in help_output
 
-    @patch('src.cli.Pipeline')
-    def test_process_video_success(self, mock_pipeline_class, tmp_path):
+    def test_process_video_success(self, tmp_path, runner, monkeypatch):
         """Test successful video processing via CLI."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         output_file = tmp_path / "output.srt"
@@ -47,12 +63,10 @@ class TestCLI:
         assert result.exit_code == 0
         mock_pipeline.process_video.assert_called_once()
 
-    @patch('src.cli.Pipeline')
-    def test_process_video_missing_input(self, mock_pipeline_class):
+    def test_process_video_missing_input(self, runner, monkeypatch):
         """Test CLI fails when input file not specified."""
-        # Arrange
-        runner = CliRunner()
-        
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         # Act
         result = runner.invoke(main, [
             '-o', 'output.srt',
@@ -62,12 +76,10 @@ class TestCLI:
         # Assert
         assert result.exit_code != 0
 
-    @patch('src.cli.Pipeline')
-    def test_process_video_missing_output(self, mock_pipeline_class):
+    def test_process_video_missing_output(self, runner, monkeypatch):
         """Test CLI fails when output file not specified."""
-        # Arrange
-        runner = CliRunner()
-        
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         # Act
         result = runner.invoke(main, [
             '-i', 'input.mp4',
@@ -77,11 +89,11 @@ class TestCLI:
         # Assert
         assert result.exit_code != 0
 
-    @patch('src.cli.Pipeline')
-    def test_process_video_missing_api_key(self, mock_pipeline_class, tmp_path):
+    def test_process_video_missing_api_key(self, tmp_path, runner, monkeypatch):
         """Test CLI fails when API key not provided."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         
@@ -94,11 +106,11 @@ class TestCLI:
         # Assert
         assert result.exit_code != 0
 
-    @patch('src.cli.Pipeline')
-    def test_process_video_api_key_from_env(self, mock_pipeline_class, tmp_path):
+    def test_process_video_api_key_from_env(self, tmp_path, runner, monkeypatch):
         """Test CLI reads API key from environment variable."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         output_file = tmp_path / "output.srt"
@@ -117,11 +129,11 @@ class TestCLI:
         assert result.exit_code == 0
         mock_pipeline_class.assert_called()
 
-    @patch('src.cli.Pipeline')
-    def test_process_video_pipeline_error(self, mock_pipeline_class, tmp_path):
+    def test_process_video_pipeline_error(self, tmp_path, runner, monkeypatch):
         """Test CLI handles pipeline errors gracefully."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         
@@ -140,11 +152,11 @@ class TestCLI:
         assert result.exit_code != 0
         assert 'error' in result.output.lower() or 'failed' in result.output.lower()
 
-    @patch('src.cli.Pipeline')
-    def test_process_video_progress_output(self, mock_pipeline_class, tmp_path):
+    def test_process_video_progress_output(self, tmp_path, runner, monkeypatch):
         """Test CLI shows progress messages."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         output_file = tmp_path / "output.srt"
@@ -167,23 +179,16 @@ class TestCLI:
         call_kwargs = mock_pipeline_class.call_args[1]
         assert 'progress_callback' in call_kwargs or 'progress' in str(call_kwargs).lower()
 
-    def test_cli_version(self):
+    def test_cli_version(self, version_output):
         """Test CLI version flag."""
-        # Arrange
-        runner = CliRunner()
-        
-        # Act
-        result = runner.invoke(main, ['--version'])
-        
-        # Assert
-        assert result.exit_code == 0
-        assert 'audio-to-subs' in result.output.lower() or '0.' in result.output
+        # Assert against the cached version text
+        assert 'audio-to-subs' in version_output.lower() or '0.' in version_output
 
-    @patch('src.cli.Pipeline')
-    def test_process_video_progress_flag(self, mock_pipeline_class, tmp_path):
+    def test_process_video_progress_flag(self, tmp_path, runner, monkeypatch):
         """Test CLI with --progress flag enables verbose progress."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         output_file = tmp_path / "output.srt"
@@ -231,12 +236,13 @@ class TestCLI:
         # Assert
         assert output_dir.exists()
 
-    @patch('src.cli.ConfigParser')
-    @patch('src.cli.Pipeline')
-    def test_batch_processing_success(self, mock_pipeline_class, mock_config_class, tmp_path):
+    def test_batch_processing_success(self, tmp_path, runner, monkeypatch):
         """Test CLI batch processing with config file."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
+        mock_config_class = MagicMock()
+        monkeypatch.setattr(cli, "ConfigParser", mock_config_class)
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 jobs:
@@ -272,11 +278,11 @@ jobs:
         mock_config_class.assert_called_once()
         mock_pipeline.process_batch.assert_called_once()
 
-    @patch('src.cli.Pipeline')
-    def test_batch_and_single_mode_conflict(self, mock_pipeline_class, tmp_path):
+    def test_batch_and_single_mode_conflict(self, tmp_path, runner, monkeypatch):
         """Test CLI rejects using both --config and --input."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         config_file = tmp_path / "config.yaml"
         config_file.write_text("jobs: []")
         
@@ -292,10 +298,9 @@ jobs:
         assert result.exit_code != 0
         assert 'Error' in result.output
 
-    def test_config_with_input_output_error(self, tmp_path):
+    def test_config_with_input_output_error(self, tmp_path, runner):
         """Test CLI rejects --config with --input or --output."""
         # Arrange
-        runner = CliRunner()
         config_file = tmp_path / "config.yaml"
         config_file.touch()
         video_file = tmp_path / "input.mp4"
@@ -312,10 +317,9 @@ jobs:
         assert result.exit_code == 1
         assert '--config cannot be used with --input' in result.output
 
-    def test_config_with_output_error(self, tmp_path):
+    def test_config_with_output_error(self, tmp_path, runner):
         """Test CLI rejects --config with --output."""
         # Arrange
-        runner = CliRunner()
         config_file = tmp_path / "config.yaml"
         config_file.touch()
         
@@ -330,10 +334,9 @@ jobs:
         assert result.exit_code == 1
         assert '--config cannot be used with --input or --output' in result.output
 
-    def test_input_file_not_found_error(self, tmp_path):
+    def test_input_file_not_found_error(self, tmp_path, runner):
         """Test CLI handles input file not found error."""
         # Arrange
-        runner = CliRunner()
         
         # Act - use non-existent file (click.Path(exists=True) will fail)
         result = runner.invoke(main, [
@@ -345,14 +348,15 @@ jobs:
         # Assert - Click validates Path(exists=True) at the option level
         assert result.exit_code != 0
 
-    @patch('src.cli._validate_output_directory')
-    @patch('src.cli.Pipeline')
-    def test_output_directory_validation_error(self, mock_pipeline_class, mock_validate, tmp_path):
+    def test_output_directory_validation_error(self, tmp_path, runner, monkeypatch):
         """Test CLI handles output directory validation error."""
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
+        mock_validate = MagicMock()
+        monkeypatch.setattr(cli, "_validate_output_directory", mock_validate)
         import click
         
         # Arrange
-        runner = CliRunner()
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         
@@ -373,13 +377,13 @@ jobs:
         assert result.exit_code == 2
         assert 'Cannot create output directory' in result.output
 
-    @patch('src.cli.Pipeline')
-    def test_pipeline_error_handling(self, mock_pipeline_class, tmp_path):
+    def test_pipeline_error_handling(self, tmp_path, runner, monkeypatch):
         """Test CLI handles PipelineError with specific error message."""
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         from src.pipeline import PipelineError
         
         # Arrange
-        runner = CliRunner()
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         
@@ -398,9 +402,10 @@ jobs:
         assert result.exit_code == 1
         assert 'Test pipeline error' in result.output
 
-    @patch('src.cli.ConfigParser')
-    def test_batch_config_error_handling(self, mock_config_parser, tmp_path):
+    def test_batch_config_error_handling(self, tmp_path, monkeypatch):
         """Test batch mode handles ConfigError."""
+        mock_config_parser = MagicMock()
+        monkeypatch.setattr(cli, "ConfigParser", mock_config_parser)
         from src.config_parser import ConfigError
         
         # Arrange
@@ -423,9 +428,10 @@ jobs:
         assert result.exit_code == 1
         assert 'Invalid config' in result.output
 
-    @patch('src.cli.Pipeline')
-    def test_batch_pipeline_error_handling(self, mock_pipeline_class, tmp_path):
+    def test_batch_pipeline_error_handling(self, tmp_path, monkeypatch):
         """Test batch mode handles PipelineError."""
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         from src.pipeline import PipelineError
         
         # Arrange
@@ -447,11 +453,8 @@ jobs:
         assert result.exit_code == 1
         assert 'Batch failed' in result.output
 
-    def test_missing_input_file(self, tmp_path):
+    def test_missing_input_file(self, tmp_path, runner):
         """Test CLI fails when input file doesn't exist (Click validation)."""
-        # Arrange
-        runner = CliRunner()
-        
         # Act
         result = runner.invoke(main, [
             '-i', str(tmp_path / 'nonexistent.mp4'),
@@ -464,11 +467,11 @@ jobs:
 
 
 
-    @patch('src.cli.Pipeline')
-    def test_batch_processing_without_api_key(self, mock_pipeline_class, tmp_path):
+    def test_batch_processing_without_api_key(self, tmp_path, runner, monkeypatch):
         """Test CLI batch mode requires API key."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         config_file = tmp_path / "config.yaml"
         config_file.write_text("jobs: []")
         
@@ -494,16 +497,17 @@ jobs:
         import click
         
         # Mock os.access to return False
-        with patch('src.cli.os.access', return_value=False):
+        with patch.object(cli.os, 'access', return_value=False):
             with pytest.raises(click.ClickException, match="not writable"):
                 _validate_output_directory(str(output_path))
 
-    @patch('src.cli.ConfigParser')
-    @patch('src.cli.Pipeline')
-    def test_batch_processing_config_error(self, mock_pipeline_class, mock_config_class, tmp_path):
+    def test_batch_processing_config_error(self, tmp_path, runner, monkeypatch):
         """Test CLI handles config errors gracefully."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
+        mock_config_class = MagicMock()
+        monkeypatch.setattr(cli, "ConfigParser", mock_config_class)
         config_file = tmp_path / "invalid.yaml"
         config_file.write_text("invalid: yaml")
         
@@ -518,12 +522,13 @@ jobs:
         # Assert
         assert result.exit_code != 0
 
-    @patch('src.cli.ConfigParser')
-    @patch('src.cli.Pipeline')
-    def test_batch_processing_pipeline_error(self, mock_pipeline_class, mock_config_class, tmp_path):
+    def test_batch_processing_pipeline_error(self, tmp_path, runner, monkeypatch):
         """Test CLI handles pipeline errors in batch mode."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
+        mock_config_class = MagicMock()
+        monkeypatch.setattr(cli, "ConfigParser", mock_config_class)
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 jobs:
@@ -552,11 +557,11 @@ jobs:
         assert result.exit_code != 0
         assert 'Error' in result.output
 
-    @patch('src.cli.Pipeline')
-    def test_single_video_api_key_required(self, mock_pipeline_class, tmp_path):
+    def test_single_video_api_key_required(self, tmp_path, runner, monkeypatch):
         """Test CLI requires API key for single video mode."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         output_file = tmp_path / "output.srt"
@@ -571,11 +576,11 @@ jobs:
         assert result.exit_code != 0
         assert 'API key' in result.output or 'api-key' in result.output.lower()
 
-    @patch('src.cli.Pipeline')
-    def test_single_video_no_api_key_env(self, mock_pipeline_class, tmp_path):
+    def test_single_video_no_api_key_env(self, tmp_path, runner, monkeypatch):
         """Test CLI fails when no API key in env or args for single video."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         output_file = tmp_path / "output.srt"
@@ -598,19 +603,20 @@ jobs:
         output_path = tmp_path / "nonexistent" / "deep" / "path" / "output.srt"
         
         # Mock mkdir to raise OSError
-        with patch('src.cli.Path.mkdir') as mock_mkdir:
+        with patch.object(cli.Path, 'mkdir') as mock_mkdir:
             mock_mkdir.side_effect = OSError("Cannot create directory")
             
             # Act & Assert
             with pytest.raises(click.ClickException, match="Cannot create"):
                 _validate_output_directory(str(output_path))
 
-    @patch('src.cli.ConfigParser')
-    @patch('src.cli.Pipeline')
-    def test_batch_config_validation_error(self, mock_pipeline_class, mock_config_class, tmp_path):
+    def test_batch_config_validation_error(self, tmp_path, runner, monkeypatch):
         """Test CLI handles config validation errors."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
+        mock_config_class = MagicMock()
+        monkeypatch.setattr(cli, "ConfigParser", mock_config_class)
         config_file = tmp_path / "config.yaml"
         config_file.write_text("jobs: []")
         
@@ -627,12 +633,13 @@ jobs:
         # Assert
         assert result.exit_code != 0
 
-    @patch('src.cli.ConfigParser')
-    @patch('src.cli.Pipeline')
-    def test_batch_jobs_error(self, mock_pipeline_class, mock_config_class, tmp_path):
+    def test_batch_jobs_error(self, tmp_path, runner, monkeypatch):
         """Test CLI handles get_jobs errors."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
+        mock_config_class = MagicMock()
+        monkeypatch.setattr(cli, "ConfigParser", mock_config_class)
         config_file = tmp_path / "config.yaml"
         config_file.write_text("jobs: []")
         
@@ -650,11 +657,11 @@ jobs:
         # Assert
         assert result.exit_code != 0
 
-    @patch('src.cli.Pipeline')
-    def test_pipeline_initialization_error(self, mock_pipeline_class, tmp_path):
+    def test_pipeline_initialization_error(self, tmp_path, runner, monkeypatch):
         """Test CLI handles pipeline initialization errors."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         output_file = tmp_path / "output.srt"
@@ -671,11 +678,11 @@ jobs:
         # Assert
         assert result.exit_code != 0
 
-    @patch('src.cli.Pipeline')
-    def test_pipeline_process_error(self, mock_pipeline_class, tmp_path):
+    def test_pipeline_process_error(self, tmp_path, runner, monkeypatch):
         """Test CLI handles pipeline processing errors."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         output_file = tmp_path / "output.srt"
@@ -695,12 +702,13 @@ jobs:
         assert result.exit_code != 0
         assert 'Error' in result.output
 
-    @patch('src.cli.ConfigParser')
-    @patch('src.cli.Pipeline')
-    def test_batch_pipeline_error(self, mock_pipeline_class, mock_config_class, tmp_path):
+    def test_batch_pipeline_error(self, tmp_path, runner, monkeypatch):
         """Test CLI handles pipeline errors in batch mode."""
         # Arrange
-        runner = CliRunner()
+        mock_pipeline_class = MagicMock()
+        monkeypatch.setattr(cli, "Pipeline", mock_pipeline_class)
+        mock_config_class = MagicMock()
+        monkeypatch.setattr(cli, "ConfigParser", mock_config_class)
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 jobs:
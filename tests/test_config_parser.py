@@ -7,11 +7,97 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-import yaml
 
 from src.config_parser import ConfigParser, ConfigError
 
 
+# Pre-serialized config shapes: writing literal strings avoids re-running the
+# YAML emitter in every test.
+EMPTY_YAML = "{}\n"
+
+EMPTY_JOBS_YAML = "jobs: []\n"
+
+SINGLE_JOB_YAML = """\
+jobs:
+  - input: video.mp4
+    output: video.srt
+"""
+
+PARTIAL_DEFAULTS_YAML = """\
+defaults:
+  temp_dir: /tmp
+jobs: []
+"""
+
+VTT_DEFAULTS_YAML = """\
+defaults:
+  format: vtt
+jobs: []
+"""
+
+MULTIPLE_JOBS_YAML = """\
+jobs:
+  - input: video1.mp4
+    output: video1.srt
+  - input: video2.mkv
+    output: video2.vtt
+    format: vtt
+"""
+
+MISSING_INPUT_YAML = """\
+jobs:
+  - output: video.srt
+"""
+
+MISSING_OUTPUT_YAML = """\
+jobs:
+  - input: video.mp4
+"""
+
+INVALID_FORMAT_YAML = """\
+jobs:
+  - input: video.mp4
+    output: video.srt
+    format: invalid
+"""
+
+FORMAT_OVERRIDE_YAML = """\
+defaults:
+  format: srt
+jobs:
+  - input: video.mp4
+    output: video.vtt
+    format: vtt
+"""
+
+NON_DICT_JOB_YAML = """\
+jobs:
+  - not a dict
+"""
+
+BATCH_PROCESSING_YAML = """\
+defaults:
+  format: srt
+jobs:
+  - input: videos/meeting.mp4
+    output: subtitles/meeting.srt
+  - input: videos/presentation.mkv
+    output: subtitles/presentation.vtt
+    format: vtt
+  - input: videos/tutorial.avi
+    output: subtitles/tutorial.sbv
+    format: sbv
+"""
+
+PATHS_YAML = """\
+jobs:
+  - input: ./videos/local.mp4
+    output: ./subtitles/local.srt
+  - input: /absolute/path/video.mp4
+    output: /absolute/output/video.srt
+"""
+
+
 @pytest.fixture
 def temp_config_dir():
     """Create temporary directory for config files."""
@@ -19,6 +105,16 @@ def temp_config_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture
+def write_config(temp_config_dir):
+    """Write pre-serialized YAML text to a config file and return its path."""
+    def _write(text, name="config.yaml"):
+        config_file = temp_config_dir / name
+        config_file.write_text(text)
+        return config_file
+    return _write
+
+
 class TestConfigParser:
     """Tests for ConfigParser class."""
 
@@ -27,57 +123,41 @@ class TestConfigParser:
         with pytest.raises(ConfigError, match="Config file not found"):
             ConfigParser("/nonexistent/path/config.yaml")
 
-    def test_init_invalid_yaml(self, temp_config_dir):
+    def test_init_invalid_yaml(self, write_config):
         """Test initialization fails with invalid YAML syntax."""
-        config_file = temp_config_dir / "bad.yaml"
-        config_file.write_text("invalid: yaml: content:")
+        config_file = write_config("invalid: yaml: content:", name="bad.yaml")
 
         with pytest.raises(ConfigError, match="Invalid YAML"):
             ConfigParser(str(config_file))
 
-    def test_init_file_read_error(self, temp_config_dir):
+    def test_init_file_read_error(self, write_config):
         """Test initialization fails when file cannot be read."""
-        config_file = temp_config_dir / "unreadable.yaml"
-        config_file.write_text("{}")
-        
+        config_file = write_config("{}", name="unreadable.yaml")
+
         # Mock open to raise an exception
         with patch('builtins.open', side_effect=OSError("Cannot read file")):
             with pytest.raises(ConfigError, match="Failed to read config"):
                 ConfigParser(str(config_file))
 
-    def test_init_valid_config(self, temp_config_dir):
+    def test_init_valid_config(self, write_config):
         """Test initialization with valid config file."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "jobs": [
-                    {"input": "video.mp4", "output": "video.srt"}
-                ]
-            })
-        )
+        config_file = write_config(SINGLE_JOB_YAML)
 
         parser = ConfigParser(str(config_file))
         assert parser.config_path == config_file
 
-    def test_get_defaults_empty_config(self, temp_config_dir):
+    def test_get_defaults_empty_config(self, write_config):
         """Test get_defaults with no defaults section."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(yaml.dump({"jobs": []}))
+        config_file = write_config(EMPTY_JOBS_YAML)
 
         parser = ConfigParser(str(config_file))
         defaults = parser.get_defaults()
 
         assert defaults["format"] == "srt"
 
-    def test_get_defaults_with_partial_defaults(self, temp_config_dir):
+    def test_get_defaults_with_partial_defaults(self, write_config):
         """Test get_defaults adds missing format to partial defaults."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "defaults": {"temp_dir": "/tmp"},
-                "jobs": []
-            })
-        )
+        config_file = write_config(PARTIAL_DEFAULTS_YAML)
 
         parser = ConfigParser(str(config_file))
         defaults = parser.get_defaults()
@@ -85,51 +165,36 @@ class TestConfigParser:
         assert defaults["format"] == "srt"
         assert defaults["temp_dir"] == "/tmp"
 
-    def test_get_defaults_with_format(self, temp_config_dir):
+    def test_get_defaults_with_format(self, write_config):
         """Test get_defaults returns custom format."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "defaults": {"format": "vtt"},
-                "jobs": []
-            })
-        )
+        config_file = write_config(VTT_DEFAULTS_YAML)
 
         parser = ConfigParser(str(config_file))
         defaults = parser.get_defaults()
 
         assert defaults["format"] == "vtt"
 
-    def test_get_jobs_no_jobs_section(self, temp_config_dir):
+    def test_get_jobs_no_jobs_section(self, write_config):
         """Test get_jobs raises error when jobs section missing."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(yaml.dump({}))
+        config_file = write_config(EMPTY_YAML)
 
         parser = ConfigParser(str(config_file))
 
         with pytest.raises(ConfigError, match="No jobs defined"):
             parser.get_jobs()
 
-    def test_get_jobs_empty_jobs(self, temp_config_dir):
+    def test_get_jobs_empty_jobs(self, write_config):
         """Test get_jobs raises error when jobs list is empty."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(yaml.dump({"jobs": []}))
+        config_file = write_config(EMPTY_JOBS_YAML)
 
         parser = ConfigParser(str(config_file))
 
         with pytest.raises(ConfigError, match="No jobs defined"):
             parser.get_jobs()
 
-    def test_get_jobs_single_job(self, temp_config_dir):
+    def test_get_jobs_single_job(self, write_config):
         """Test get_jobs returns single job."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "jobs": [
-                    {"input": "video.mp4", "output": "video.srt"}
-                ]
-            })
-        )
+        config_file = write_config(SINGLE_JOB_YAML)
 
         parser = ConfigParser(str(config_file))
         jobs = parser.get_jobs()
@@ -139,17 +204,9 @@ class TestConfigParser:
         assert jobs[0]["output"] == "video.srt"
         assert jobs[0]["format"] == "srt"  # default
 
-    def test_get_jobs_multiple_jobs(self, temp_config_dir):
+    def test_get_jobs_multiple_jobs(self, write_config):
         """Test get_jobs returns multiple jobs."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "jobs": [
-                    {"input": "video1.mp4", "output": "video1.srt"},
-                    {"input": "video2.mkv", "output": "video2.vtt", "format": "vtt"}
-                ]
-            })
-        )
+        config_file = write_config(MULTIPLE_JOBS_YAML)
 
         parser = ConfigParser(str(config_file))
         jobs = parser.get_jobs()
@@ -158,75 +215,45 @@ class TestConfigParser:
         assert jobs[0]["format"] == "srt"
         assert jobs[1]["format"] == "vtt"
 
-    def test_get_jobs_missing_input(self, temp_config_dir):
+    def test_get_jobs_missing_input(self, write_config):
         """Test get_jobs raises error when input is missing."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "jobs": [
-                    {"output": "video.srt"}
-                ]
-            })
-        )
+        config_file = write_config(MISSING_INPUT_YAML)
 
         parser = ConfigParser(str(config_file))
 
         with pytest.raises(ConfigError, match="missing required field: input"):
             parser.get_jobs()
 
-    def test_get_jobs_missing_output(self, temp_config_dir):
+    def test_get_jobs_missing_output(self, write_config):
         """Test get_jobs raises error when output is missing."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "jobs": [
-                    {"input": "video.mp4"}
-                ]
-            })
-        )
+        config_file = write_config(MISSING_OUTPUT_YAML)
 
         parser = ConfigParser(str(config_file))
 
         with pytest.raises(ConfigError, match="missing required field: output"):
             parser.get_jobs()
 
-    def test_get_jobs_invalid_format(self, temp_config_dir):
+    def test_get_jobs_invalid_format(self, write_config):
         """Test get_jobs raises error with unsupported format."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "jobs": [
-                    {"input": "video.mp4", "output": "video.srt", "format": "invalid"}
-                ]
-            })
-        )
+        config_file = write_config(INVALID_FORMAT_YAML)
 
         parser = ConfigParser(str(config_file))
 
         with pytest.raises(ConfigError, match="unsupported format"):
             parser.get_jobs()
 
-    def test_get_jobs_format_override(self, temp_config_dir):
+    def test_get_jobs_format_override(self, write_config):
         """Test job format overrides defaults."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "defaults": {"format": "srt"},
-                "jobs": [
-                    {"input": "video.mp4", "output": "video.vtt", "format": "vtt"}
-                ]
-            })
-        )
+        config_file = write_config(FORMAT_OVERRIDE_YAML)
 
         parser = ConfigParser(str(config_file))
         jobs = parser.get_jobs()
 
         assert jobs[0]["format"] == "vtt"
 
-    def test_get_jobs_non_dict_job(self, temp_config_dir):
+    def test_get_jobs_non_dict_job(self, write_config):
         """Test get_jobs raises error when job is not a dict."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(yaml.dump({"jobs": ["not a dict"]}))
+        config_file = write_config(NON_DICT_JOB_YAML)
 
         parser = ConfigParser(str(config_file))
 
@@ -240,24 +267,16 @@ class TestConfigParser:
         assert "webvtt" in ConfigParser.SUPPORTED_FORMATS
         assert "sbv" in ConfigParser.SUPPORTED_FORMATS
 
-    def test_validate_returns_true(self, temp_config_dir):
+    def test_validate_returns_true(self, write_config):
         """Test validate returns True for valid config."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "jobs": [
-                    {"input": "video.mp4", "output": "video.srt"}
-                ]
-            })
-        )
+        config_file = write_config(SINGLE_JOB_YAML)
 
         parser = ConfigParser(str(config_file))
         assert parser.validate() is True
 
-    def test_validate_raises_on_invalid(self, temp_config_dir):
+    def test_validate_raises_on_invalid(self, write_config):
         """Test validate raises error for invalid config."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(yaml.dump({}))
+        config_file = write_config(EMPTY_YAML)
 
         parser = ConfigParser(str(config_file))
 
@@ -269,19 +288,9 @@ class TestConfigParser:
 class TestConfigParserRealWorld:
     """Integration tests with realistic config scenarios."""
 
-    def test_batch_processing_config(self, temp_config_dir):
+    def test_batch_processing_config(self, write_config):
         """Test realistic batch processing configuration."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "defaults": {"format": "srt"},
-                "jobs": [
-                    {"input": "videos/meeting.mp4", "output": "subtitles/meeting.srt"},
-                    {"input": "videos/presentation.mkv", "output": "subtitles/presentation.vtt", "format": "vtt"},
-                    {"input": "videos/tutorial.avi", "output": "subtitles/tutorial.sbv", "format": "sbv"}
-                ]
-            })
-        )
+        config_file = write_config(BATCH_PROCESSING_YAML)
 
         parser = ConfigParser(str(config_file))
         jobs = parser.get_jobs()
@@ -291,17 +300,9 @@ class TestConfigParserRealWorld:
         assert jobs[1]["format"] == "vtt"
         assert jobs[2]["format"] == "sbv"
 
-    def test_config_with_paths(self, temp_config_dir):
+    def test_config_with_paths(self, write_config):
         """Test config with relative and absolute paths."""
-        config_file = temp_config_dir / "config.yaml"
-        config_file.write_text(
-            yaml.dump({
-                "jobs": [
-                    {"input": "./videos/local.mp4", "output": "./subtitles/local.srt"},
-                    {"input": "/absolute/path/video.mp4", "output": "/absolute/output/video.srt"}
-                ]
-            })
-        )
+        config_file = write_config(PATHS_YAML)
 
         parser = ConfigParser(str(config_file))
         jobs = parser.get_jobs()
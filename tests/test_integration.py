@@ -1,23 +1,44 @@
 """Integration tests with real Mistral AI API."""
+import functools
 import pytest
 import os
 from pathlib import Path
 from src.pipeline import Pipeline
 
 
-@pytest.fixture
+@functools.cache
+def _resolve_api_key():
+    """Resolve the Mistral API key from env or the repo key file, once.
+
+    The key file is read as bytes so the placeholder check compares a raw
+    prefix without decoding; decoding happens only for a usable key.
+
+    Returns:
+        The API key string, or None if unconfigured or still a placeholder.
+    """
+    api_key = os.getenv('MISTRAL_API_KEY')
+    if api_key:
+        return None if api_key.startswith('REPLACE') else api_key
+
+    api_key_file = Path(__file__).resolve().parents[1] / '.mistral_api_key'
+    if not api_key_file.exists():
+        return None
+
+    raw = api_key_file.read_bytes().strip()
+    if not raw or raw.startswith(b'REPLACE'):
+        return None
+
+    return raw.decode('ascii')
+
+
+@pytest.fixture(scope="session")
 def mistral_api_key():
     """Load Mistral API key from .mistral_api_key file or env."""
-    api_key = os.getenv('MISTRAL_API_KEY')
-    
+    api_key = _resolve_api_key()
+
     if not api_key:
-        api_key_file = Path('/home/guillaume/Development/audio-to-subs/.mistral_api_key')
-        if api_key_file.exists():
-            api_key = api_key_file.read_text().strip()
-    
-    if not api_key or api_key.startswith('REPLACE'):
         pytest.skip('Mistral API key not configured')
-    
+
     return api_key
 
 
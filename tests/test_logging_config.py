@@ -12,18 +12,35 @@ import pytest
 from src.logging_config import configure_logging
 
 
+# Snapshot of logging state captured once at import; each test restores it
+# instead of rebuilding its own copy
+_LOGGING_SNAPSHOT = (
+    logging.root.level,
+    logging.root.handlers[:],
+    {
+        name: lg.level
+        for name, lg in logging.root.manager.loggerDict.items()
+        if isinstance(lg, logging.Logger)
+    },
+)
+
+
+def _restore_logging():
+    """Restore root and named logger state from the import-time snapshot."""
+    level, handlers, levels = _LOGGING_SNAPSHOT
+    logging.root.level = level
+    logging.root.handlers[:] = handlers
+    for name, lg in logging.root.manager.loggerDict.items():
+        if isinstance(lg, logging.Logger):
+            # Loggers created after the snapshot go back to inheriting
+            lg.level = levels.get(name, logging.NOTSET)
+
+
 @pytest.fixture(autouse=True)
 def reset_logging():
-    """Reset logging configuration before and after each test."""
-    # Store original handlers and config
-    original_handlers = logging.root.handlers[:]
-    original_level = logging.root.level
-
+    """Reset logging configuration after each test."""
     yield
-
-    # Restore original state
-    logging.root.handlers = original_handlers
-    logging.root.level = original_level
+    _restore_logging()
 
 
 class TestConfigureLogging:
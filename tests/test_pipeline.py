@@ -1,47 +1,53 @@
 """Tests for pipeline module."""
 
+import re
+
 import pytest
-from unittest.mock import patch, MagicMock
-from pathlib import Path
+from unittest.mock import MagicMock
+from src import pipeline as pipeline_module
 from src.pipeline import Pipeline, PipelineError
 
+# Precompiled once; pytest.raises(match=...) otherwise re-compiles the
+# pattern on every call
+_ERR_VIDEO_NOT_FOUND = re.compile("Video file not found")
+_ERR_EXTRACTION = re.compile("Audio extraction failed")
+_ERR_TRANSCRIPTION = re.compile("Transcription failed")
+_ERR_GENERATION = re.compile("Subtitle generation failed")
+_ERR_EMPTY_SEGMENTS = re.compile("AI service did not return timestamp data")
+
 
 class TestPipeline:
-    """Test video to subtitles pipeline."""
-
-    @patch("src.pipeline.needs_splitting")
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_process_video_success(
-        self,
-        mock_extract,
-        mock_transcription_class,
-        mock_generator_class,
-        mock_needs_split,
-        tmp_path,
-    ):
-        """Test successful end-to-end video processing."""
-        # Arrange
+    """Test video to subtitles pipeline.
+
+    Dependency patching comes from the shared pipeline_mocks fixture;
+    each test only wires the behavior it exercises.
+    """
+
+    @pytest.fixture
+    def media_files(self, tmp_path):
+        """Return the video/audio paths used by most tests.
+
+        Only the video file is created: _extract_audio stats it before
+        calling the (mocked) extractor. The audio path is just a string
+        handed between mocks, so touching it would waste syscalls.
+        """
         video_file = tmp_path / "test.mp4"
         video_file.touch()
         audio_file = tmp_path / "audio.wav"
-        audio_file.touch()
-        output_file = tmp_path / "output.srt"
+        return video_file, audio_file
 
-        mock_needs_split.return_value = False
-        mock_extract.return_value = str(audio_file)
+    def test_process_video_success(self, pipeline_mocks, media_files, tmp_path):
+        """Test successful end-to-end video processing."""
+        # Arrange
+        video_file, audio_file = media_files
+        output_file = tmp_path / "output.srt"
 
-        mock_transcription = MagicMock()
-        mock_transcription_class.return_value = mock_transcription
-        mock_transcription.transcribe_audio_with_timestamps.return_value = [
+        pipeline_mocks.extract_audio.return_value = str(audio_file)
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.return_value = [
             {"start": 0.0, "end": 2.5, "text": "Hello"},
             {"start": 2.5, "end": 5.0, "text": "World"},
         ]
-
-        mock_generator = MagicMock()
-        mock_generator_class.return_value = mock_generator
-        mock_generator.generate.return_value = str(output_file)
+        pipeline_mocks.generator.generate.return_value = str(output_file)
 
         pipeline = Pipeline(api_key="test_key")
 
@@ -50,154 +56,81 @@ class TestPipeline:
 
         # Assert
         assert result == str(output_file)
-        mock_extract.assert_called_once()
-        mock_transcription.transcribe_audio_with_timestamps.assert_called_once()
-        mock_generator.generate.assert_called_once()
+        pipeline_mocks.extract_audio.assert_called_once()
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.assert_called_once()
+        pipeline_mocks.generator.generate.assert_called_once()
 
-    @patch("src.pipeline.extract_audio")
-    def test_process_video_video_not_found(self, mock_extract, tmp_path):
+    def test_process_video_video_not_found(self, pipeline_mocks):
         """Test pipeline fails when video file not found."""
         # Arrange
-        mock_extract.side_effect = FileNotFoundError("Video not found")
+        pipeline_mocks.extract_audio.side_effect = FileNotFoundError("Video not found")
         pipeline = Pipeline(api_key="test_key")
 
         # Act & Assert
-        with pytest.raises(PipelineError, match="Video file not found"):
+        with pytest.raises(PipelineError, match=_ERR_VIDEO_NOT_FOUND):
             pipeline.process_video("nonexistent.mp4", "output.srt")
 
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_process_video_extraction_fails(
-        self, mock_extract, mock_transcription_class, mock_generator_class, tmp_path
-    ):
+    def test_process_video_extraction_fails(self, pipeline_mocks, media_files):
         """Test pipeline fails when audio extraction fails."""
         # Arrange
-        video_file = tmp_path / "test.mp4"
-        video_file.touch()
-
-        mock_extract.side_effect = Exception("FFmpeg error")
+        video_file, _ = media_files
+        pipeline_mocks.extract_audio.side_effect = Exception("FFmpeg error")
         pipeline = Pipeline(api_key="test_key")
 
         # Act & Assert
-        with pytest.raises(PipelineError, match="Audio extraction failed"):
+        with pytest.raises(PipelineError, match=_ERR_EXTRACTION):
             pipeline.process_video(str(video_file), "output.srt")
 
-    @patch("src.pipeline.needs_splitting")
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_process_video_transcription_fails(
-        self,
-        mock_extract,
-        mock_transcription_class,
-        mock_generator_class,
-        mock_needs_split,
-        tmp_path,
-    ):
+    def test_process_video_transcription_fails(self, pipeline_mocks, media_files):
         """Test pipeline fails when transcription fails."""
         # Arrange
-        video_file = tmp_path / "test.mp4"
-        video_file.touch()
-        audio_file = tmp_path / "audio.wav"
-        audio_file.touch()
-
-        mock_needs_split.return_value = False
-        mock_extract.return_value = str(audio_file)
-
-        mock_transcription = MagicMock()
-        mock_transcription_class.return_value = mock_transcription
-        mock_transcription.transcribe_audio_with_timestamps.side_effect = Exception(
-            "API error"
+        video_file, audio_file = media_files
+        pipeline_mocks.extract_audio.return_value = str(audio_file)
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.side_effect = (
+            Exception("API error")
         )
 
         pipeline = Pipeline(api_key="test_key")
 
         # Act & Assert
-        with pytest.raises(PipelineError, match="Transcription failed"):
+        with pytest.raises(PipelineError, match=_ERR_TRANSCRIPTION):
             pipeline.process_video(str(video_file), "output.srt")
 
-    @patch("src.pipeline.needs_splitting")
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_process_video_subtitle_generation_fails(
-        self,
-        mock_extract,
-        mock_transcription_class,
-        mock_generator_class,
-        mock_needs_split,
-        tmp_path,
-    ):
+    def test_process_video_subtitle_generation_fails(self, pipeline_mocks, media_files):
         """Test pipeline fails when subtitle generation fails."""
         # Arrange
-        video_file = tmp_path / "test.mp4"
-        video_file.touch()
-        audio_file = tmp_path / "audio.wav"
-        audio_file.touch()
-
-        mock_needs_split.return_value = False
-        mock_extract.return_value = str(audio_file)
-
-        mock_transcription = MagicMock()
-        mock_transcription_class.return_value = mock_transcription
-        mock_transcription.transcribe_audio_with_timestamps.return_value = [
+        video_file, audio_file = media_files
+        pipeline_mocks.extract_audio.return_value = str(audio_file)
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.return_value = [
             {"start": 0.0, "end": 2.5, "text": "Test"}
         ]
-
-        mock_generator = MagicMock()
-        mock_generator_class.return_value = mock_generator
-        mock_generator.generate.side_effect = Exception("Write failed")
+        pipeline_mocks.generator.generate.side_effect = Exception("Write failed")
 
         pipeline = Pipeline(api_key="test_key")
 
         # Act & Assert
-        with pytest.raises(PipelineError, match="Subtitle generation failed"):
+        with pytest.raises(PipelineError, match=_ERR_GENERATION):
             pipeline.process_video(str(video_file), "output.srt")
 
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_process_video_no_api_key(
-        self, mock_extract, mock_transcription_class, mock_generator_class
-    ):
+    def test_process_video_no_api_key(self, pipeline_mocks):
         """Test pipeline raises error when no API key provided."""
         # Act & Assert
         with pytest.raises(ValueError, match="API key is required"):
             Pipeline(api_key=None)
 
-    @patch("src.pipeline.needs_splitting")
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
     def test_process_video_with_progress_callback(
-        self,
-        mock_extract,
-        mock_transcription_class,
-        mock_generator_class,
-        mock_needs_split,
-        tmp_path,
+        self, pipeline_mocks, media_files, tmp_path
     ):
         """Test pipeline calls progress callback at each stage."""
         # Arrange
-        video_file = tmp_path / "test.mp4"
-        video_file.touch()
-        audio_file = tmp_path / "audio.wav"
-        audio_file.touch()
+        video_file, audio_file = media_files
         output_file = tmp_path / "output.srt"
 
-        mock_needs_split.return_value = False
-        mock_extract.return_value = str(audio_file)
-
-        mock_transcription = MagicMock()
-        mock_transcription_class.return_value = mock_transcription
-        mock_transcription.transcribe_audio_with_timestamps.return_value = [
+        pipeline_mocks.extract_audio.return_value = str(audio_file)
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.return_value = [
             {"start": 0.0, "end": 2.5, "text": "Test"}
         ]
-
-        mock_generator = MagicMock()
-        mock_generator_class.return_value = mock_generator
-        mock_generator.generate.return_value = str(output_file)
+        pipeline_mocks.generator.generate.return_value = str(output_file)
 
         progress_callback = MagicMock()
         pipeline = Pipeline(api_key="test_key", progress_callback=progress_callback)
@@ -212,79 +145,38 @@ class TestPipeline:
         # Find a call with "transcrib" in it (may be at different index depending on pipeline)
         assert any("transcrib" in call.lower() for call in calls)
 
-    @patch("src.pipeline.needs_splitting")
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_pipeline_with_empty_segments(
-        self,
-        mock_extract,
-        mock_transcription_class,
-        mock_generator_class,
-        mock_needs_split,
-        tmp_path,
-    ):
+    def test_pipeline_with_empty_segments(self, pipeline_mocks, media_files):
         """Test pipeline fails when transcription returns empty segments."""
         # Arrange
-        video_file = tmp_path / "test.mp4"
-        video_file.touch()
-        audio_file = tmp_path / "audio.wav"
-        audio_file.touch()
-
-        mock_needs_split.return_value = False
-        mock_extract.return_value = str(audio_file)
-
-        mock_transcription = MagicMock()
-        mock_transcription_class.return_value = mock_transcription
+        video_file, audio_file = media_files
+        pipeline_mocks.extract_audio.return_value = str(audio_file)
         # Return empty segments
-        mock_transcription.transcribe_audio_with_timestamps.return_value = []
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.return_value = []
 
         pipeline = Pipeline(api_key="test_key")
 
         # Act & Assert
-        with pytest.raises(PipelineError, match="AI service did not return timestamp data"):
+        with pytest.raises(PipelineError, match=_ERR_EMPTY_SEGMENTS):
             pipeline.process_video(str(video_file), "output.srt")
 
-    @patch("src.pipeline.split_audio")
-    @patch("src.pipeline.needs_splitting")
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_pipeline_with_multiple_segments(
-        self,
-        mock_extract,
-        mock_transcription_class,
-        mock_generator_class,
-        mock_needs_split,
-        mock_split_audio,
-        tmp_path,
-    ):
+    def test_pipeline_with_multiple_segments(self, pipeline_mocks, media_files, tmp_path):
         """Test pipeline with multiple audio segments."""
         # Arrange
-        video_file = tmp_path / "test.mp4"
-        video_file.touch()
-        audio_file1 = tmp_path / "audio1.wav"
-        audio_file1.touch()
+        video_file, audio_file1 = media_files
         audio_file2 = tmp_path / "audio2.wav"
-        audio_file2.touch()
 
-        mock_needs_split.return_value = True
-        mock_extract.return_value = str(audio_file1)
+        pipeline_mocks.needs_splitting.return_value = True
+        pipeline_mocks.extract_audio.return_value = str(audio_file1)
         # Return pre-split audio segments
-        mock_split_audio.return_value = [str(audio_file1), str(audio_file2)]
+        pipeline_mocks.split_audio.return_value = [str(audio_file1), str(audio_file2)]
 
-        mock_transcription = MagicMock()
-        mock_transcription_class.return_value = mock_transcription
         # Segment 1: 0-5 seconds
         # Segment 2: 4-10 seconds (with overlap)
-        mock_transcription.transcribe_audio_with_timestamps.side_effect = [
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.side_effect = [
             [{"start": 0.0, "end": 5.0, "text": "Hello"}],
             [{"start": 0.0, "end": 6.0, "text": "World"}],
         ]
-
-        mock_generator = MagicMock()
-        mock_generator_class.return_value = mock_generator
-        mock_generator.generate.return_value = "output.srt"
+        pipeline_mocks.generator.generate.return_value = "output.srt"
 
         pipeline = Pipeline(api_key="test_key")
 
@@ -294,143 +186,202 @@ class TestPipeline:
         # Assert
         assert result == "output.srt"
         # Verify transcription was called twice (once per segment)
-        assert mock_transcription.transcribe_audio_with_timestamps.call_count == 2
+        assert (
+            pipeline_mocks.transcription.transcribe_audio_with_timestamps.call_count == 2
+        )
         # Verify split_audio was called
-        mock_split_audio.assert_called_once()
-
-    @patch("src.pipeline.needs_splitting")
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_pipeline_cleanup_on_error(
-        self,
-        mock_extract,
-        mock_transcription_class,
-        mock_generator_class,
-        mock_needs_split,
-        tmp_path,
-    ):
+        pipeline_mocks.split_audio.assert_called_once()
+
+    def test_pipeline_cleanup_on_error(self, pipeline_mocks, media_files):
         """Test pipeline cleans up temp files on error."""
         # Arrange
-        video_file = tmp_path / "test.mp4"
-        video_file.touch()
-        audio_file = tmp_path / "audio.wav"
-        audio_file.touch()
-
-        mock_needs_split.return_value = False
-        mock_extract.return_value = str(audio_file)
-
-        mock_transcription = MagicMock()
-        mock_transcription_class.return_value = mock_transcription
-        mock_transcription.transcribe_audio_with_timestamps.side_effect = Exception("API error")
+        video_file, audio_file = media_files
+        audio_file.touch()  # must exist on disk to exercise the removal branch
+        pipeline_mocks.extract_audio.return_value = str(audio_file)
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.side_effect = (
+            Exception("API error")
+        )
 
         pipeline = Pipeline(api_key="test_key")
 
         # Act & Assert
-        with pytest.raises(PipelineError, match="Transcription failed"):
+        with pytest.raises(PipelineError, match=_ERR_TRANSCRIPTION):
             pipeline.process_video(str(video_file), "output.srt")
-        
+
         # Note: We can't easily verify the cleanup happened due to container isolation,
         # but the cleanup code path is tested
 
-    @patch("src.pipeline.needs_splitting")
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_process_video_extract_audio_ffmpeg_error(
-        self,
-        mock_extract,
-        mock_transcription_class,
-        mock_generator_class,
-        mock_needs_split,
-        tmp_path,
-    ):
+    def test_process_video_extract_audio_ffmpeg_error(self, pipeline_mocks, media_files):
         """Test FFmpegNotFoundError in _extract_audio (lines 213-214)."""
         from src.audio_extractor import FFmpegNotFoundError
-        
+
         # Arrange
-        video_file = tmp_path / "test.mp4"
-        video_file.touch()
-        
-        mock_needs_split.return_value = False
-        mock_extract.side_effect = FFmpegNotFoundError("ffmpeg not found")
-        
+        video_file, _ = media_files
+        pipeline_mocks.extract_audio.side_effect = FFmpegNotFoundError("ffmpeg not found")
+
         pipeline = Pipeline(api_key="test_key")
-        
+
         # Act & Assert
-        with pytest.raises(PipelineError, match="Audio extraction failed"):
+        with pytest.raises(PipelineError, match=_ERR_EXTRACTION):
             pipeline.process_video(str(video_file), "output.srt")
 
-    @patch("src.pipeline.needs_splitting")
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_process_video_transcription_error(
-        self,
-        mock_extract,
-        mock_transcription_class,
-        mock_generator_class,
-        mock_needs_split,
-        tmp_path,
-    ):
+    def test_process_video_transcription_error(self, pipeline_mocks, media_files):
         """Test TranscriptionError in _transcribe_audio_segments (line 273)."""
         from src.transcription_client import TranscriptionError
-        
+
         # Arrange
-        video_file = tmp_path / "test.mp4"
-        video_file.touch()
-        audio_file = tmp_path / "audio.wav"
-        audio_file.touch()
-        
-        mock_needs_split.return_value = False
-        mock_extract.return_value = str(audio_file)
-        
-        mock_transcription = MagicMock()
-        mock_transcription_class.return_value = mock_transcription
-        mock_transcription.transcribe_audio_with_timestamps.side_effect = TranscriptionError("Transcription failed")
-        
+        video_file, audio_file = media_files
+        pipeline_mocks.extract_audio.return_value = str(audio_file)
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.side_effect = (
+            TranscriptionError("Transcription failed")
+        )
+
         pipeline = Pipeline(api_key="test_key")
-        
+
         # Act & Assert
         with pytest.raises(PipelineError, match="Transcription failed: Transcription failed"):
             pipeline.process_video(str(video_file), "output.srt")
 
-    @patch("src.pipeline.needs_splitting")
-    @patch("src.pipeline.SubtitleGenerator")
-    @patch("src.pipeline.TranscriptionClient")
-    @patch("src.pipeline.extract_audio")
-    def test_generate_subtitles_format_error(
-        self,
-        mock_extract,
-        mock_transcription_class,
-        mock_generator_class,
-        mock_needs_split,
-        tmp_path,
-    ):
+    def test_generate_subtitles_format_error(self, pipeline_mocks, media_files):
         """Test SubtitleFormatError in _generate_subtitles (line 302)."""
         from src.subtitle_generator import SubtitleFormatError
-        
+
         # Arrange
-        video_file = tmp_path / "test.mp4"
-        video_file.touch()
-        audio_file = tmp_path / "audio.wav"
-        audio_file.touch()
-        
-        mock_needs_split.return_value = False
-        mock_extract.return_value = str(audio_file)
-        
-        mock_transcription = MagicMock()
-        mock_transcription_class.return_value = mock_transcription
-        mock_transcription.transcribe_audio_with_timestamps.return_value = [
+        video_file, audio_file = media_files
+        pipeline_mocks.extract_audio.return_value = str(audio_file)
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.return_value = [
             {"start": 0.0, "end": 2.5, "text": "Hello"},
         ]
-        
-        mock_generator = MagicMock()
-        mock_generator_class.return_value = mock_generator
-        mock_generator.generate.side_effect = SubtitleFormatError("Invalid format")
-        
+        pipeline_mocks.generator.generate.side_effect = SubtitleFormatError(
+            "Invalid format"
+        )
+
         pipeline = Pipeline(api_key="test_key")
-        
+
         # Act & Assert
         with pytest.raises(PipelineError, match="Subtitle generation failed: Invalid format"):
             pipeline.process_video(str(video_file), "output.srt")
+
+    def test_process_video_streamed_success(
+        self, pipeline_mocks, media_files, tmp_path, monkeypatch
+    ):
+        """Test the streamed path transcribes from memory, skipping the temp WAV."""
+        # Arrange
+        video_file, _ = media_files
+        output_file = tmp_path / "output.srt"
+
+        extract_to_buffer = MagicMock(return_value=b"RIFF_fake_wav_data")
+        monkeypatch.setattr(
+            pipeline_module, "extract_audio_to_buffer", extract_to_buffer
+        )
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.return_value = [
+            {"start": 0.0, "end": 2.5, "text": "Hello"},
+        ]
+        pipeline_mocks.generator.generate.return_value = str(output_file)
+
+        pipeline = Pipeline(api_key="test_key", stream_audio=True)
+
+        # Act
+        result = pipeline.process_video(str(video_file), str(output_file))
+
+        # Assert
+        assert result == str(output_file)
+        extract_to_buffer.assert_called_once_with(str(video_file))
+        # The file-based extractor must never run on the streamed path
+        pipeline_mocks.extract_audio.assert_not_called()
+        # The buffer is uploaded under the video's stem, not a real path
+        call_args = pipeline_mocks.transcription.transcribe_audio_with_timestamps.call_args
+        assert call_args[0][0] == "test.wav"
+        assert call_args[1]["audio_bytes"] == b"RIFF_fake_wav_data"
+        pipeline_mocks.generator.generate.assert_called_once()
+
+    def test_process_video_streamed_ffmpeg_missing(
+        self, pipeline_mocks, media_files, monkeypatch
+    ):
+        """Test the streamed path fails when ffmpeg is not installed."""
+        from src.audio_extractor import FFmpegNotFoundError
+
+        # Arrange
+        video_file, _ = media_files
+        monkeypatch.setattr(
+            pipeline_module,
+            "extract_audio_to_buffer",
+            MagicMock(side_effect=FFmpegNotFoundError("ffmpeg not found")),
+        )
+
+        pipeline = Pipeline(api_key="test_key", stream_audio=True)
+
+        # Act & Assert
+        with pytest.raises(PipelineError, match=_ERR_EXTRACTION):
+            pipeline.process_video(str(video_file), "output.srt")
+
+    def test_process_video_streamed_extraction_fails(
+        self, pipeline_mocks, media_files, monkeypatch
+    ):
+        """Test the streamed path fails when in-memory extraction fails."""
+        from src.audio_extractor import AudioExtractionError
+
+        # Arrange
+        video_file, _ = media_files
+        monkeypatch.setattr(
+            pipeline_module,
+            "extract_audio_to_buffer",
+            MagicMock(side_effect=AudioExtractionError("ffmpeg pipe closed")),
+        )
+
+        pipeline = Pipeline(api_key="test_key", stream_audio=True)
+
+        # Act & Assert
+        with pytest.raises(PipelineError, match=_ERR_EXTRACTION):
+            pipeline.process_video(str(video_file), "output.srt")
+
+    def test_process_video_streamed_empty_segments(
+        self, pipeline_mocks, media_files, monkeypatch
+    ):
+        """Test the streamed path fails when transcription returns no segments."""
+        # Arrange
+        video_file, _ = media_files
+        monkeypatch.setattr(
+            pipeline_module,
+            "extract_audio_to_buffer",
+            MagicMock(return_value=b"RIFF_fake_wav_data"),
+        )
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.return_value = []
+
+        pipeline = Pipeline(api_key="test_key", stream_audio=True)
+
+        # Act & Assert
+        with pytest.raises(PipelineError, match=_ERR_EMPTY_SEGMENTS):
+            pipeline.process_video(str(video_file), "output.srt")
+
+    def test_process_video_streamed_falls_back_when_probe_fails(
+        self, pipeline_mocks, media_files, monkeypatch
+    ):
+        """Test the pipeline falls back to the file path when ffprobe fails."""
+        # Arrange
+        video_file, audio_file = media_files
+        extract_to_buffer = MagicMock(return_value=b"RIFF_fake_wav_data")
+        monkeypatch.setattr(
+            pipeline_module, "extract_audio_to_buffer", extract_to_buffer
+        )
+        # First call is _can_stream probing the video; second is the
+        # file path checking the extracted audio
+        pipeline_mocks.needs_splitting.side_effect = [
+            RuntimeError("ffprobe failed"),
+            False,
+        ]
+        pipeline_mocks.extract_audio.return_value = str(audio_file)
+        pipeline_mocks.transcription.transcribe_audio_with_timestamps.return_value = [
+            {"start": 0.0, "end": 2.5, "text": "Hello"},
+        ]
+        pipeline_mocks.generator.generate.return_value = "output.srt"
+
+        pipeline = Pipeline(api_key="test_key", stream_audio=True)
+
+        # Act
+        result = pipeline.process_video(str(video_file), "output.srt")
+
+        # Assert
+        assert result == "output.srt"
+        extract_to_buffer.assert_not_called()
+        pipeline_mocks.extract_audio.assert_called_once()
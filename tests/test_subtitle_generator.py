@@ -1,4 +1,6 @@
 """Tests for subtitle_generator module."""
+import re
+
 import pytest
 from pathlib import Path
 import src.subtitle_generator  # Import module for coverage
@@ -9,55 +11,37 @@ from src.subtitle_generator import (
     segment_text,
 )
 
+# Precompiled once; pytest.raises(match=...) otherwise re-compiles the
+# pattern on every call
+_ERR_MISSING_FIELD = re.compile("Missing required field")
+_ERR_INVALID_TIMECODE = re.compile("Invalid timecode")
+_ERR_INVALID_LANGUAGE = re.compile("Invalid language code")
 
-class TestTimestampFormatting:
-    """Test timestamp formatting for SRT."""
 
-    def test_format_timestamp_zero(self):
-        """Test formatting timestamp at 0 seconds."""
-        # Act
-        result = format_timestamp_srt(0.0)
-        
-        # Assert
-        assert result == "00:00:00,000"
+@pytest.fixture(scope="module")
+def generator():
+    """Shared SubtitleGenerator; the class is stateless."""
+    return SubtitleGenerator()
 
-    def test_format_timestamp_basic(self):
-        """Test formatting basic timestamp."""
-        # Act
-        result = format_timestamp_srt(65.5)
-        
-        # Assert
-        assert result == "00:01:05,500"
 
-    def test_format_timestamp_with_hours(self):
-        """Test formatting timestamp with hours."""
-        # Act
-        result = format_timestamp_srt(3661.123)
-        
-        # Assert
-        assert result == "01:01:01,123"
-
-    def test_format_timestamp_large_value(self):
-        """Test formatting large timestamp."""
-        # Act
-        result = format_timestamp_srt(36000.999)
-        
-        # Assert
-        assert result == "10:00:00,999"
+class TestTimestampFormatting:
+    """Test timestamp formatting for SRT."""
 
-    def test_format_timestamp_rounds_milliseconds(self):
-        """Test that milliseconds are rounded correctly."""
-        # Act
-        result = format_timestamp_srt(5.9999)
-        
-    def test_format_timestamp_edge_values(self):
-        """Test timestamp formatting with edge values (0, large values)."""
-        # Test 0
-        assert format_timestamp_srt(0.0) == "00:00:00,000"
-        # Test large value
-        assert format_timestamp_srt(86400.0) == "24:00:00,000"
-        # Test value with milliseconds
-        assert format_timestamp_srt(1.5) == "00:00:01,500"
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (0.0, "00:00:00,000"),
+            (1.5, "00:00:01,500"),
+            (65.5, "00:01:05,500"),
+            (3661.123, "01:01:01,123"),
+            (36000.999, "10:00:00,999"),
+            (5.9999, "00:00:06,000"),  # milliseconds round
+            (86400.0, "24:00:00,000"),  # no day rollover
+        ],
+    )
+    def test_format_timestamp(self, value, expected):
+        """Test SRT timestamp formatting across zero, hour, and edge values."""
+        assert format_timestamp_srt(value) == expected
 
 
 class TestSegmentText:
@@ -170,57 +154,50 @@ class TestTimestampFormattingAllFormats:
 class TestSubtitleGeneratorValidation:
     """Test subtitle generator validation."""
 
-    def test_validate_segment_missing_start(self):
+    def test_validate_segment_missing_start(self, generator):
         """Test _validate_segment raises error when start is missing."""
-        generator = SubtitleGenerator()
         
         # Act & Assert
-        with pytest.raises(SubtitleFormatError, match="Missing required field"):
+        with pytest.raises(SubtitleFormatError, match=_ERR_MISSING_FIELD):
             generator._validate_segment({"end": 1.0, "text": "test"})
 
-    def test_validate_segment_missing_end(self):
+    def test_validate_segment_missing_end(self, generator):
         """Test _validate_segment raises error when end is missing."""
-        generator = SubtitleGenerator()
         
         # Act & Assert
-        with pytest.raises(SubtitleFormatError, match="Missing required field"):
+        with pytest.raises(SubtitleFormatError, match=_ERR_MISSING_FIELD):
             generator._validate_segment({"start": 0.0, "text": "test"})
 
-    def test_validate_segment_missing_text(self):
+    def test_validate_segment_missing_text(self, generator):
         """Test _validate_segment raises error when text is missing."""
-        generator = SubtitleGenerator()
         
         # Act & Assert
-        with pytest.raises(SubtitleFormatError, match="Missing required field"):
+        with pytest.raises(SubtitleFormatError, match=_ERR_MISSING_FIELD):
             generator._validate_segment({"start": 0.0, "end": 1.0})
 
-    def test_validate_segment_negative_start(self):
+    def test_validate_segment_negative_start(self, generator):
         """Test _validate_segment raises error for negative start time."""
-        generator = SubtitleGenerator()
         
         # Act & Assert
         with pytest.raises(SubtitleFormatError, match="Invalid timecode 'start'"):
             generator._validate_segment({"start": -1.0, "end": 1.0, "text": "test"})
 
-    def test_validate_segment_negative_end(self):
+    def test_validate_segment_negative_end(self, generator):
         """Test _validate_segment raises error for negative end time."""
-        generator = SubtitleGenerator()
         
         # Act & Assert
         with pytest.raises(SubtitleFormatError, match="Invalid timecode 'end'"):
             generator._validate_segment({"start": 0.0, "end": -1.0, "text": "test"})
 
-    def test_validate_segment_end_before_start(self):
+    def test_validate_segment_end_before_start(self, generator):
         """Test _validate_segment raises error when end < start."""
-        generator = SubtitleGenerator()
         
         # Act & Assert
         with pytest.raises(SubtitleFormatError, match="end.*before start"):
             generator._validate_segment({"start": 5.0, "end": 2.0, "text": "test"})
 
-    def test_validate_segment_string_times(self):
+    def test_validate_segment_string_times(self, generator):
         """Test _validate_segment with string time values."""
-        generator = SubtitleGenerator()
         
         # Act & Assert
         with pytest.raises(SubtitleFormatError, match="Invalid timecode 'start'"):
@@ -230,9 +207,8 @@ class TestSubtitleGeneratorValidation:
 class TestLanguageCodeHandling:
     """Test language code handling in subtitle generation."""
 
-    def test_is_valid_language_code_valid(self):
+    def test_is_valid_language_code_valid(self, generator):
         """Test _is_valid_language_code with valid codes."""
-        generator = SubtitleGenerator()
         
         # Act & Assert
         assert generator._is_valid_language_code("en") is True
@@ -240,9 +216,8 @@ class TestLanguageCodeHandling:
         assert generator._is_valid_language_code("eng") is True
         assert generator._is_valid_language_code("spa") is True
 
-    def test_is_valid_language_code_invalid(self):
+    def test_is_valid_language_code_invalid(self, generator):
         """Test _is_valid_language_code with invalid codes."""
-        generator = SubtitleGenerator()
         
         # Act & Assert
         assert generator._is_valid_language_code("") is False
@@ -251,23 +226,21 @@ class TestLanguageCodeHandling:
         assert generator._is_valid_language_code("123") is False  # Not alphabetic
         assert generator._is_valid_language_code("en_US") is False  # Contains non-alphabetic
 
-    def test_generate_with_invalid_language_code(self, tmp_path):
+    def test_generate_with_invalid_language_code(self, generator, tmp_path):
         """Test generate raises error for invalid language code."""
-        generator = SubtitleGenerator()
         output_file = tmp_path / "output.srt"
         segments = [{"start": 0.0, "end": 1.0, "text": "test"}]
         
         # Act & Assert
-        with pytest.raises(SubtitleFormatError, match="Invalid language code"):
+        with pytest.raises(SubtitleFormatError, match=_ERR_INVALID_LANGUAGE):
             generator.generate(segments, str(output_file), "srt", language_code="invalid123")
 
 
 class TestSubtitleGeneratorEdgeCases:
     """Test edge cases in subtitle generation."""
 
-    def test_generate_with_empty_segments(self, tmp_path):
+    def test_generate_with_empty_segments(self, generator, tmp_path):
         """Test generate with empty segments list."""
-        generator = SubtitleGenerator()
         output_file = tmp_path / "output.srt"
         
         # Act
@@ -276,9 +249,8 @@ class TestSubtitleGeneratorEdgeCases:
         # Assert - should return empty file path
         assert result == str(output_file)
 
-    def test_generate_with_multiline_text(self, tmp_path):
+    def test_generate_with_multiline_text(self, generator, tmp_path):
         """Test generate with multiline text in segments."""
-        generator = SubtitleGenerator()
         output_file = tmp_path / "output.srt"
         segments = [{"start": 0.0, "end": 5.0, "text": "Line 1\nLine 2\nLine 3"}]
         
@@ -296,30 +268,25 @@ class TestSubtitleGeneratorEdgeCases:
 class TestSubtitleGenerator:
     """Test SRT subtitle generation."""
 
-    def test_generate_srt_single_segment(self, tmp_path):
+    def test_generate_srt_single_segment(self, generator):
         """Test generating SRT with single segment."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = [
             {"start": 0.0, "end": 2.5, "text": "First subtitle"}
         ]
-        output_file = tmp_path / "output.srt"
-         
-        # Act
-        result = generator.generate_srt(segments, str(output_file))
-         
+
+        # Act - render in memory; the file-writing branch is covered by
+        # test_generate_srt_write_to_file
+        content = generator.render(segments, "srt")
+
         # Assert
-        assert result == str(output_file)
-        assert output_file.exists()
-        content = output_file.read_text()
         assert "1" in content
         assert "00:00:00,000 --> 00:00:02,500" in content
         assert "First subtitle" in content
 
-    def test_generate_with_language_code(self, tmp_path):
+    def test_generate_with_language_code(self, generator, tmp_path):
         """Test generating subtitles with language code in filename."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = [
             {"start": 0.0, "end": 2.5, "text": "First subtitle"}
         ]
@@ -336,10 +303,9 @@ class TestSubtitleGenerator:
         content = result_path.read_text()
         assert "First subtitle" in content
 
-    def test_generate_without_language_code(self, tmp_path):
+    def test_generate_without_language_code(self, generator, tmp_path):
         """Test generating subtitles without language code preserves original filename."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = [
             {"start": 0.0, "end": 2.5, "text": "First subtitle"}
         ]
@@ -353,23 +319,21 @@ class TestSubtitleGenerator:
         assert result_path == output_file
         assert result_path.exists()
 
-    def test_generate_invalid_language_code(self, tmp_path):
+    def test_generate_invalid_language_code(self, generator, tmp_path):
         """Test generating subtitles with invalid language code raises error."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = [
             {"start": 0.0, "end": 2.5, "text": "First subtitle"}
         ]
         output_file = tmp_path / "output.srt"
         
         # Act & Assert
-        with pytest.raises(SubtitleFormatError, match="Invalid language code"):
+        with pytest.raises(SubtitleFormatError, match=_ERR_INVALID_LANGUAGE):
             generator.generate(segments, str(output_file), "srt", "en1")
 
-    def test_generate_different_formats_with_language(self, tmp_path):
+    def test_generate_different_formats_with_language(self, generator, tmp_path):
         """Test generating different subtitle formats with language codes."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = [
             {"start": 0.0, "end": 2.5, "text": "Test subtitle"}
         ]
@@ -389,9 +353,8 @@ class TestSubtitleGenerator:
         result_sbv = generator.generate(segments, str(output_sbv), "sbv", "de")
         assert Path(result_sbv).name == "output.de.sbv"
 
-    def test_language_code_validation(self):
+    def test_language_code_validation(self, generator):
         """Test language code validation logic."""
-        generator = SubtitleGenerator()
         
         # Valid language codes
         valid_codes = ["en", "fr", "es", "de", "it", "pt", "ru", "zh", "ja", "ko", "eng", "fra", "spa"]
@@ -403,9 +366,8 @@ class TestSubtitleGenerator:
         for code in invalid_codes:
             assert generator._is_valid_language_code(code) is False
 
-    def test_filename_generation_logic(self):
+    def test_filename_generation_logic(self, generator):
         """Test filename generation logic directly."""
-        generator = SubtitleGenerator()
         
         # Test basic filename generation
         result = generator._generate_output_filename("output.srt", "srt", "en")
@@ -423,22 +385,19 @@ class TestSubtitleGenerator:
         result = generator._generate_output_filename("output.srt", "srt", None)
         assert result == "output.srt"
 
-    def test_generate_srt_multiple_segments(self, tmp_path):
+    def test_generate_srt_multiple_segments(self, generator):
         """Test generating SRT with multiple segments."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = [
             {"start": 0.0, "end": 2.5, "text": "First"},
             {"start": 2.5, "end": 5.0, "text": "Second"},
             {"start": 5.0, "end": 8.5, "text": "Third"}
         ]
-        output_file = tmp_path / "output.srt"
-        
+
         # Act
-        generator.generate_srt(segments, str(output_file))
-        
+        content = generator.render(segments, "srt")
+
         # Assert
-        content = output_file.read_text()
         lines = content.strip().split('\n')
         # Should have 3 blocks of (index + timecode + text + blank)
         assert len([line for line in lines if line.strip()]) == 9  # 3*(1+1+1)
@@ -446,10 +405,9 @@ class TestSubtitleGenerator:
         assert "2\n00:00:02,500 --> 00:00:05,000\nSecond" in content
         assert "3\n00:00:05,000 --> 00:00:08,500\nThird" in content
 
-    def test_generate_srt_empty_segments(self, tmp_path):
+    def test_generate_srt_empty_segments(self, generator, tmp_path):
         """Test generating SRT with empty segments list."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = []
         output_file = tmp_path / "output.srt"
         
@@ -461,64 +419,56 @@ class TestSubtitleGenerator:
         content = output_file.read_text()
         assert content.strip() == ""
 
-    def test_generate_srt_missing_fields(self, tmp_path):
+    def test_generate_srt_missing_fields(self, generator, tmp_path):
         """Test generating SRT raises error with missing required fields."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = [
             {"start": 0.0, "end": 2.5}  # Missing 'text'
         ]
         output_file = tmp_path / "output.srt"
         
         # Act & Assert
-        with pytest.raises(SubtitleFormatError, match="Missing required field"):
+        with pytest.raises(SubtitleFormatError, match=_ERR_MISSING_FIELD):
             generator.generate_srt(segments, str(output_file))
 
-    def test_generate_srt_invalid_timecode(self, tmp_path):
+    def test_generate_srt_invalid_timecode(self, generator, tmp_path):
         """Test generating SRT raises error with invalid timecode."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = [
             {"start": -1.0, "end": 2.5, "text": "Invalid"}
         ]
         output_file = tmp_path / "output.srt"
         
         # Act & Assert
-        with pytest.raises(SubtitleFormatError, match="Invalid timecode"):
+        with pytest.raises(SubtitleFormatError, match=_ERR_INVALID_TIMECODE):
             generator.generate_srt(segments, str(output_file))
 
-    def test_generate_srt_multiline_text(self, tmp_path):
+    def test_generate_srt_multiline_text(self, generator):
         """Test generating SRT with multiline subtitle text."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = [
             {"start": 0.0, "end": 2.5, "text": "Line 1\nLine 2"}
         ]
-        output_file = tmp_path / "output.srt"
-        
+
         # Act
-        generator.generate_srt(segments, str(output_file))
-        
+        content = generator.render(segments, "srt")
+
         # Assert
-        content = output_file.read_text()
         assert "Line 1" in content
         assert "Line 2" in content
 
-    def test_generate_srt_long_text_segmentation(self, tmp_path):
+    def test_generate_srt_long_text_segmentation(self, generator):
         """Test generating SRT with long text that requires segmentation."""
         # Arrange
-        generator = SubtitleGenerator()
         long_text = "This is a very long subtitle text that should be segmented into multiple lines to comply with subtitle width constraints and best practices for readability on screen."
         segments = [
             {"start": 0.0, "end": 5.0, "text": long_text}
         ]
-        output_file = tmp_path / "output.srt"
-        
+
         # Act
-        generator.generate_srt(segments, str(output_file))
-        
+        content = generator.render(segments, "srt")
+
         # Assert
-        content = output_file.read_text()
         lines = [line for line in content.split('\n') if line.strip() and not line[0].isdigit() and '-->' not in line]
         
         # Should have multiple lines due to segmentation
@@ -557,10 +507,9 @@ class TestSubtitleGenerator:
         result = segment_text(short_text)
         assert result == [short_text]
 
-    def test_generate_srt_write_to_file(self, tmp_path):
+    def test_generate_srt_write_to_file(self, generator, tmp_path):
         """Test that SRT file is written with correct permissions."""
         # Arrange
-        generator = SubtitleGenerator()
         segments = [
             {"start": 0.0, "end": 2.5, "text": "Test"}
         ]
@@ -573,8 +522,32 @@ class TestSubtitleGenerator:
         assert output_file.is_file()
         assert output_file.stat().st_size > 0
 
+    def test_generate_srt_thousand_segments_constant_factor(self, generator):
+        """Test SRT output length matches the closed form for 10k segments.
 
-class TestSegmentText:
+        Locks in the join-once rendering contract: every block must
+        contribute exactly its own bytes, which repeated string
+        concatenation bugs (duplicated separators, O(n^2) re-emission)
+        would break.
+        """
+        # Arrange
+        count = 10_000
+        segments = [
+            {"start": float(i), "end": float(i + 1), "text": "word"}
+            for i in range(count)
+        ]
+
+        # Act
+        content = generator.render(segments, "srt")
+
+        # Assert: index digits + newline + 29-char timestamp line + newline
+        # + 4-char text + blank-line terminator, per block
+        expected_length = sum(len(str(i)) for i in range(1, count + 1)) + 37 * count
+        assert len(content) == expected_length
+        assert content.endswith("word\n\n")
+
+
+class TestSegmentTextEdgeCases:
     """Test segment_text function edge cases."""
 
     def test_segment_text_with_empty_paragraphs(self):
@@ -1,16 +1,53 @@
 """Tests for transcription_client module."""
 
+import asyncio
+import io
+from collections import namedtuple
+
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import MagicMock, AsyncMock
+from src import transcription_client as transcription_client_module
 from src.transcription_client import (
     TranscriptionClient,
     TranscriptionError,
     AudioFileError,
 )
 
+# Cheap stand-in for SDK segment objects; constructing and reading a
+# namedtuple costs a fraction of a MagicMock with preset attributes
+Segment = namedtuple("Segment", "start end text")
+
 
 class TestTranscriptionClient:
-    """Test Mistral AI transcription client."""
+    """Test Mistral AI transcription client.
+
+    File access and the SDK client are replaced by the fake_audio and
+    mock_mistral fixtures; monkeypatched lambdas and a BytesIO payload
+    are far cheaper per test than stacked mock_open/@patch decorators.
+    """
+
+    @pytest.fixture
+    def fake_audio(self, monkeypatch):
+        """Pretend every audio path exists and reads as a small payload."""
+        monkeypatch.setattr(
+            transcription_client_module.Path, "exists", lambda self: True
+        )
+        monkeypatch.setattr(
+            transcription_client_module.os.path, "getsize", lambda path: 1024
+        )
+        monkeypatch.setattr(
+            "builtins.open",
+            lambda *args, **kwargs: io.BytesIO(b"fake_audio_data"),
+        )
+
+    @pytest.fixture
+    def mock_mistral(self, monkeypatch):
+        """Replace the SDK client class and return the instance it yields."""
+        mock_client = MagicMock()
+        monkeypatch.setattr(
+            transcription_client_module, "Mistral", MagicMock(return_value=mock_client)
+        )
+        return mock_client
 
     def test_client_initialization_with_api_key(self):
         """Test client initializes with provided API key."""
@@ -26,21 +63,12 @@ class TestTranscriptionClient:
         with pytest.raises(ValueError, match="API key is required"):
             TranscriptionClient(api_key=None)
 
-    @patch("src.transcription_client.os.path.getsize")
-    @patch("src.transcription_client.Path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_audio_data")
-    @patch("src.transcription_client.Mistral")
-    def test_transcribe_audio_success(self, mock_mistral_class, mock_file, mock_exists, mock_getsize):
+    def test_transcribe_audio_success(self, fake_audio, mock_mistral):
         """Test successful audio transcription."""
         # Arrange
-        mock_exists.return_value = True
-        mock_getsize.return_value = 1024
-        mock_client = MagicMock()
-        mock_mistral_class.return_value = mock_client
-
         mock_response = MagicMock()
         mock_response.text = "This is a test transcription."
-        mock_client.audio.transcriptions.complete.return_value = mock_response
+        mock_mistral.audio.transcriptions.complete.return_value = mock_response
 
         client = TranscriptionClient(api_key="test_key")
 
@@ -49,10 +77,9 @@ class TestTranscriptionClient:
 
         # Assert
         assert result == "This is a test transcription."
-        mock_client.audio.transcriptions.complete.assert_called_once()
+        mock_mistral.audio.transcriptions.complete.assert_called_once()
 
-    @patch("src.transcription_client.Mistral")
-    def test_transcribe_audio_file_not_found(self, mock_mistral_class):
+    def test_transcribe_audio_file_not_found(self, mock_mistral):
         """Test transcription fails when audio file doesn't exist."""
         # Arrange
         client = TranscriptionClient(api_key="test_key")
@@ -61,18 +88,10 @@ class TestTranscriptionClient:
         with pytest.raises(AudioFileError, match="Audio file not found"):
             client.transcribe_audio("nonexistent.wav")
 
-    @patch("src.transcription_client.Path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_audio_data")
-    @patch("src.transcription_client.Mistral")
-    def test_transcribe_audio_api_error(
-        self, mock_mistral_class, mock_file, mock_exists
-    ):
+    def test_transcribe_audio_api_error(self, fake_audio, mock_mistral):
         """Test transcription handles API errors."""
         # Arrange
-        mock_exists.return_value = True
-        mock_client = MagicMock()
-        mock_mistral_class.return_value = mock_client
-        mock_client.audio.transcriptions.complete.side_effect = Exception("API Error")
+        mock_mistral.audio.transcriptions.complete.side_effect = Exception("API Error")
 
         client = TranscriptionClient(api_key="test_key")
 
@@ -80,27 +99,16 @@ class TestTranscriptionClient:
         with pytest.raises(TranscriptionError, match="Transcription failed"):
             client.transcribe_audio("test_audio.wav")
 
-    @patch("src.transcription_client.os.path.getsize")
-    @patch("src.transcription_client.Path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_audio_data")
-    @patch("src.transcription_client.Mistral")
-    def test_transcribe_with_timestamps(
-        self, mock_mistral_class, mock_file, mock_exists, mock_getsize
-    ):
+    def test_transcribe_with_timestamps(self, fake_audio, mock_mistral):
         """Test transcription with timestamp data."""
         # Arrange
-        mock_exists.return_value = True
-        mock_getsize.return_value = 1024
-        mock_client = MagicMock()
-        mock_mistral_class.return_value = mock_client
-
         mock_response = MagicMock()
         mock_response.text = "Test transcription"
         mock_response.segments = [
-            MagicMock(start=0.0, end=2.5, text="Test"),
-            MagicMock(start=2.5, end=5.0, text="transcription"),
+            Segment(start=0.0, end=2.5, text="Test"),
+            Segment(start=2.5, end=5.0, text="transcription"),
         ]
-        mock_client.audio.transcriptions.complete.return_value = mock_response
+        mock_mistral.audio.transcriptions.complete.return_value = mock_response
 
         client = TranscriptionClient(api_key="test_key")
 
@@ -116,21 +124,12 @@ class TestTranscriptionClient:
         assert result[1]["end"] == 5.0
         assert result[1]["text"] == "transcription"
 
-    @patch("src.transcription_client.os.path.getsize")
-    @patch("src.transcription_client.Path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_audio_data")
-    @patch("src.transcription_client.Mistral")
-    def test_transcribe_audio_with_language(self, mock_mistral_class, mock_file, mock_exists, mock_getsize):
+    def test_transcribe_audio_with_language(self, fake_audio, mock_mistral):
         """Test transcription with language parameter."""
         # Arrange
-        mock_exists.return_value = True
-        mock_getsize.return_value = 1024
-        mock_client = MagicMock()
-        mock_mistral_class.return_value = mock_client
-
         mock_response = MagicMock()
         mock_response.text = "Bonjour"
-        mock_client.audio.transcriptions.complete.return_value = mock_response
+        mock_mistral.audio.transcriptions.complete.return_value = mock_response
 
         client = TranscriptionClient(api_key="test_key", language="fr")
 
@@ -140,15 +139,11 @@ class TestTranscriptionClient:
         # Assert
         assert result == "Bonjour"
         # Verify language was passed to API
-        call_kwargs = mock_client.audio.transcriptions.complete.call_args[1]
+        call_kwargs = mock_mistral.audio.transcriptions.complete.call_args[1]
         assert call_kwargs.get("language") == "en"
 
-    @patch("src.transcription_client.os.path.getsize")
-    @patch("src.transcription_client.Path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_audio_data")
-    @patch("src.transcription_client.Mistral")
     def test_transcribe_audio_with_timestamps_and_progress(
-        self, mock_mistral_class, mock_file, mock_exists, mock_getsize
+        self, fake_audio, mock_mistral
     ):
         """Test transcription with timestamps and progress callback."""
         # Arrange
@@ -157,17 +152,12 @@ class TestTranscriptionClient:
         def mock_progress_callback(message: str, percentage: int = None):
             progress_messages.append((message, percentage))
 
-        mock_exists.return_value = True
-        mock_getsize.return_value = 2048
-        mock_client = MagicMock()
-        mock_mistral_class.return_value = mock_client
-
         mock_response = MagicMock()
         mock_response.text = "Test"
         mock_response.segments = [
-            MagicMock(start=0.0, end=2.5, text="Test"),
+            Segment(start=0.0, end=2.5, text="Test"),
         ]
-        mock_client.audio.transcriptions.complete.return_value = mock_response
+        mock_mistral.audio.transcriptions.complete.return_value = mock_response
 
         client = TranscriptionClient(
             api_key="test_key",
@@ -194,31 +184,49 @@ class TestTranscriptionClient:
         assert 0 in percentages
         assert 100 in percentages
 
-    @patch("src.transcription_client.Path.exists")
-    def test_transcribe_audio_with_timestamps_file_not_found(self, mock_exists):
+    def test_transcribe_with_timestamps_from_buffer(self, mock_mistral):
+        """Test the audio_bytes branch uploads the buffer without disk access."""
+        # Arrange
+        # Deliberately no fake_audio fixture: the path does not exist, so
+        # any attempt to stat or open it would fail the test
+        mock_response = MagicMock()
+        mock_response.text = "Buffered"
+        mock_response.segments = [
+            Segment(start=0.0, end=1.5, text="Buffered"),
+        ]
+        mock_mistral.audio.transcriptions.complete.return_value = mock_response
+
+        client = TranscriptionClient(api_key="test_key")
+
+        # Act
+        result = client.transcribe_audio_with_timestamps(
+            "/nonexistent/buffered_audio.wav", audio_bytes=b"fake_wav_bytes"
+        )
+
+        # Assert
+        assert len(result) == 1
+        assert result[0]["text"] == "Buffered"
+        # The File is built from the buffer, named after the path's basename
+        call_kwargs = mock_mistral.audio.transcriptions.complete.call_args[1]
+        uploaded = call_kwargs["file"]
+        assert bytes(uploaded.content) == b"fake_wav_bytes"
+        assert uploaded.file_name == "buffered_audio.wav"
+
+    def test_transcribe_audio_with_timestamps_file_not_found(self, mock_mistral):
         """Test transcription with timestamps fails when file not found."""
         # Arrange
-        mock_exists.return_value = False
         client = TranscriptionClient(api_key="test_key")
 
         # Act & Assert
         with pytest.raises(AudioFileError, match="Audio file not found"):
             client.transcribe_audio_with_timestamps("nonexistent.wav")
 
-    @patch("src.transcription_client.os.path.getsize")
-    @patch("src.transcription_client.Path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_audio_data")
-    @patch("src.transcription_client.Mistral")
     def test_transcribe_audio_with_timestamps_api_error(
-        self, mock_mistral_class, mock_file, mock_exists, mock_getsize
+        self, fake_audio, mock_mistral
     ):
         """Test transcription with timestamps handles API errors."""
         # Arrange
-        mock_exists.return_value = True
-        mock_getsize.return_value = 1024
-        mock_client = MagicMock()
-        mock_mistral_class.return_value = mock_client
-        mock_client.audio.transcriptions.complete.side_effect = Exception("API Error")
+        mock_mistral.audio.transcriptions.complete.side_effect = Exception("API Error")
 
         client = TranscriptionClient(api_key="test_key")
 
@@ -226,27 +234,17 @@ class TestTranscriptionClient:
         with pytest.raises(TranscriptionError, match="Transcription failed"):
             client.transcribe_audio_with_timestamps("test_audio.wav")
 
-    @patch("src.transcription_client.os.path.getsize")
-    @patch("src.transcription_client.Path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_audio_data")
-    @patch("src.transcription_client.Mistral")
     def test_transcribe_audio_with_timestamps_no_segments(
-        self, mock_mistral_class, mock_file, mock_exists, mock_getsize
+        self, fake_audio, mock_mistral
     ):
         """Test transcription with timestamps when response has no segments."""
         # Arrange
-        mock_exists.return_value = True
-        mock_getsize.return_value = 1024
-        mock_client = MagicMock()
-        mock_mistral_class.return_value = mock_client
-
         # Use a plain object without segments attribute
         class MockResponse:
             def __init__(self):
                 self.text = "Test without segments"
-        
-        mock_response = MockResponse()
-        mock_client.audio.transcriptions.complete.return_value = mock_response
+
+        mock_mistral.audio.transcriptions.complete.return_value = MockResponse()
 
         client = TranscriptionClient(api_key="test_key")
 
@@ -255,3 +253,79 @@ class TestTranscriptionClient:
 
         # Assert - should return empty list
         assert result == []
+
+    def test_transcribe_audio_async_success(self, fake_audio, mock_mistral):
+        """Test successful async audio transcription."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.text = "Async transcription."
+        mock_mistral.audio.transcriptions.complete_async = AsyncMock(
+            return_value=mock_response
+        )
+
+        client = TranscriptionClient(api_key="test_key")
+
+        # Act
+        result = asyncio.run(client.transcribe_audio_async("test_audio.wav"))
+
+        # Assert
+        assert result == "Async transcription."
+        mock_mistral.audio.transcriptions.complete_async.assert_called_once()
+
+    def test_transcribe_segments_concurrent(self, fake_audio, mock_mistral):
+        """Test concurrent transcription of multiple segments preserves order."""
+        # Arrange
+        # Key responses on the uploaded filename: file reads happen on
+        # worker threads, so completion order is not deterministic
+        responses = {"segment_001.wav": "first", "segment_002.wav": "second"}
+        mock_mistral.audio.transcriptions.complete_async = AsyncMock(
+            side_effect=lambda **kwargs: MagicMock(
+                text=responses[kwargs["file"].file_name]
+            )
+        )
+
+        client = TranscriptionClient(api_key="test_key")
+
+        # Act
+        result = asyncio.run(
+            client.transcribe_segments(["segment_001.wav", "segment_002.wav"])
+        )
+
+        # Assert
+        assert result == ["first", "second"]
+        assert mock_mistral.audio.transcriptions.complete_async.call_count == 2
+
+    def test_transcribe_many_sync_wrapper(self, fake_audio, mock_mistral):
+        """Test the sync wrapper drives the concurrent path without a loop."""
+        # Arrange
+        responses = {"segment_001.wav": "first", "segment_002.wav": "second"}
+        mock_mistral.audio.transcriptions.complete_async = AsyncMock(
+            side_effect=lambda **kwargs: MagicMock(
+                text=responses[kwargs["file"].file_name]
+            )
+        )
+
+        client = TranscriptionClient(api_key="test_key")
+
+        # Act
+        result = client.transcribe_many(["segment_001.wav", "segment_002.wav"])
+
+        # Assert
+        assert result == ["first", "second"]
+
+    def test_transcribe_sequence_preserves_order(self, fake_audio, mock_mistral):
+        """Test sequential transcription yields results in input order."""
+        # Arrange
+        responses = [MagicMock(text="first"), MagicMock(text="second")]
+        mock_mistral.audio.transcriptions.complete.side_effect = responses
+
+        client = TranscriptionClient(api_key="test_key")
+
+        # Act
+        result = list(
+            client.transcribe_sequence(["segment_001.wav", "segment_002.wav"])
+        )
+
+        # Assert
+        assert result == ["first", "second"]
+        assert mock_mistral.audio.transcriptions.complete.call_count == 2